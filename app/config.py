@@ -3,49 +3,207 @@ Configuration module for Guardian Seven Best Shows Monitor.
 Loads configuration from config.ini file and secrets from .env file.
 """
 
+import heapq
 import os
-import configparser
+import re
+import threading
 from pathlib import Path
-from typing import Optional
-from dotenv import load_dotenv
+from typing import Dict, Optional
 import logging
+import logging.handlers
 from datetime import datetime
 
+# Precompiled byte-level patterns for the lightweight INI reader below
+_SECTION_RE = re.compile(rb'^\[([^\]]+)\]\s*$')
+_KV_RE = re.compile(rb'^\s*([^=;#\s][^=]*?)\s*=\s*(.*?)\s*$')
+
+_BOOLEAN_STATES = {
+    '1': True, 'yes': True, 'true': True, 'on': True,
+    '0': False, 'no': False, 'false': False, 'off': False,
+}
+
+
+def _parse_ini_fast(path: Path) -> Dict[str, Dict[str, str]]:
+    """
+    Parse a small, flat INI file into a dict of sections.
+
+    A lightweight replacement for configparser: config.ini is a simple
+    header/key=value file, so a single pass with two regexes is enough.
+    The scan runs on raw bytes and decodes only the captured section
+    names, keys, and values, skipping a whole-file text decode.
+
+    Args:
+        path: Path to the INI file
+
+    Returns:
+        Dictionary mapping section names to key/value dictionaries
+    """
+    sections: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+
+    for line in path.read_bytes().split(b'\n'):
+        stripped = line.strip()
+        if not stripped or stripped.startswith((b'#', b';')):
+            continue
+
+        section_match = _SECTION_RE.match(stripped)
+        if section_match:
+            current = sections.setdefault(section_match.group(1).decode('utf-8'), {})
+            continue
+
+        kv_match = _KV_RE.match(line)
+        if kv_match and current is not None:
+            key = kv_match.group(1).decode('utf-8').lower()
+            current[key] = kv_match.group(2).decode('utf-8')
+
+    return sections
+
+
+def _getbool(section: Dict[str, str], key: str, default: bool = False) -> bool:
+    """Get a boolean value from a parsed INI section."""
+    value = section.get(key)
+    if value is None:
+        return default
+    return _BOOLEAN_STATES.get(value.lower(), default)
+
+
+def _getint(section: Dict[str, str], key: str, default: int = 0) -> int:
+    """Get an integer value from a parsed INI section."""
+    value = section.get(key)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _get_env_value(path: Path, key: str) -> Optional[str]:
+    """
+    Extract a single KEY=value assignment from a .env file.
+
+    The app only ever reads one secret, so scanning for that key avoids
+    parsing every assignment and pushing it into os.environ.
+
+    Args:
+        path: Path to the .env file
+        key: Environment variable name to look up
+
+    Returns:
+        The value if found, None otherwise
+    """
+    pattern = re.compile(
+        rb'^' + re.escape(key.encode()) + rb'\s*=\s*["\']?([^"\'\r\n]*)["\']?\s*$',
+        re.MULTILINE,
+    )
+    try:
+        match = pattern.search(path.read_bytes())
+    except OSError:
+        return None
+    return match.group(1).decode('utf-8') if match else None
+
+
+# Cache of parsed Config instances keyed by (path, mtime_ns) so repeated
+# Config() calls become a dict lookup instead of file I/O + parse
+_CONFIG_CACHE: Dict[tuple, 'Config'] = {}
+
 class Config:
     """Configuration class that loads settings from config.ini and secrets from .env."""
-    
+
+    # Fixed attribute layout: skips the per-instance __dict__ and makes
+    # attribute access on the hot paths a direct slot lookup
+    __slots__ = (
+        'project_root',
+        'discord_webhook_url',
+        'guardian_series_urls',
+        'guardian_series_url',
+        'guardian_base_url',
+        'send_error_notifications',
+        'data_directory',
+        'request_timeout',
+        'user_agent',
+        'retry_attempts',
+        'retry_delay',
+        'log_level',
+        'log_to_file',
+        'log_file',
+        '_summary',
+        '_logging_configured',
+        '_data_directory_path',
+        '_log_file_path',
+    )
+
+    # Direct log-level lookup table, avoiding a logging-module dict walk
+    _LEVELS = {
+        'DEBUG': logging.DEBUG,
+        'INFO': logging.INFO,
+        'WARNING': logging.WARNING,
+        'ERROR': logging.ERROR,
+        'CRITICAL': logging.CRITICAL,
+    }
+
+    # Shared formatter - the format string never changes, so build it once
+    _FORMATTER = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    # datefmt has no sub-second field, so skip the msec append
+    _FORMATTER.default_msec_format = None
+
     def __init__(self, config_path: Optional[str] = None, env_path: Optional[str] = None):
         """
         Initialize configuration by loading from config files.
-        
+
         Args:
             config_path: Path to config.ini file. Defaults to project root.
             env_path: Path to .env file. Defaults to project root.
         """
         self.project_root = Path(__file__).parent.parent
-        
+
+        # Reuse a previously parsed config if the file hasn't changed
+        config_file = Path(config_path) if config_path else self.project_root / 'config.ini'
+        cache_key = None
+        if config_file.exists():
+            cache_key = (str(config_file), config_file.stat().st_mtime_ns)
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached is not None:
+                for name in self.__slots__:
+                    if name != 'project_root' and hasattr(cached, name):
+                        setattr(self, name, getattr(cached, name))
+                return
+
         # Load environment variables (secrets)
         self._load_env_file(env_path)
-        
+
         # Load configuration from INI file
         self._load_config_file(config_path)
-        
+
         # Validate configuration
         self._validate_config()
-    
+
+        self._summary: Optional[dict] = None
+
+        if cache_key is not None:
+            _CONFIG_CACHE[cache_key] = self
+
     def _load_env_file(self, env_path: Optional[str] = None):
-        """Load environment variables from .env file."""
+        """Load the Discord webhook secret from the environment or .env file."""
         if env_path:
+            # Deferred import: only the explicit env_path branch needs the
+            # full dotenv parser, so normal startup skips the import cost
+            from dotenv import load_dotenv
             load_dotenv(env_path)
-        else:
+            self.discord_webhook_url = os.getenv('DISCORD_WEBHOOK_URL')
+            return
+
+        # Fast path: only DISCORD_WEBHOOK_URL is ever read, so look up
+        # that single key instead of parsing the whole .env file
+        value = os.getenv('DISCORD_WEBHOOK_URL')
+        if value is None:
             env_file = self.project_root / '.env'
             if env_file.exists():
-                load_dotenv(env_file)
-            else:
-                load_dotenv()  # Load from system environment
-        
-        # Load secrets from environment
-        self.discord_webhook_url = os.getenv('DISCORD_WEBHOOK_URL')
+                value = _get_env_value(env_file, 'DISCORD_WEBHOOK_URL')
+        self.discord_webhook_url = value
     
     def _load_config_file(self, config_path: Optional[str] = None):
         """Load configuration from INI file."""
@@ -57,37 +215,46 @@ class Config:
         if not config_file.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_file}")
         
-        config = configparser.ConfigParser()
-        config.read(config_file)
-        
+        sections = _parse_ini_fast(config_file)
+
         # Guardian Configuration
-        guardian_section = config['guardian']
+        guardian_section = sections.get('guardian', {})
         # Support series_urls (list) with fallback to series_url (singular)
         raw_urls = guardian_section.get('series_urls') or guardian_section.get('series_url') or ''
         self.guardian_series_urls: list[str] = [u.strip() for u in raw_urls.split(',') if u.strip()]
         self.guardian_series_url = self.guardian_series_urls[0] if self.guardian_series_urls else ''
         self.guardian_base_url = guardian_section.get('base_url')
-        
+
         # Application Settings
-        app_section = config['application']
-        self.send_error_notifications = app_section.getboolean('send_error_notifications')
-        
+        app_section = sections.get('application', {})
+        self.send_error_notifications = _getbool(app_section, 'send_error_notifications')
+
         # Storage Settings
-        storage_section = config['storage']
+        storage_section = sections.get('storage', {})
         self.data_directory = storage_section.get('data_directory') or 'data'
-        
+
         # HTTP Settings
-        http_section = config['http']
-        self.request_timeout = http_section.getint('request_timeout')
+        http_section = sections.get('http', {})
+        self.request_timeout = _getint(http_section, 'request_timeout')
         self.user_agent = http_section.get('user_agent')
-        self.retry_attempts = http_section.getint('retry_attempts')
-        self.retry_delay = http_section.getint('retry_delay')
-        
+        self.retry_attempts = _getint(http_section, 'retry_attempts')
+        self.retry_delay = _getint(http_section, 'retry_delay')
+
         # Logging Settings
-        logging_section = config['logging']
+        logging_section = sections.get('logging', {})
         self.log_level = (logging_section.get('log_level') or 'INFO').upper()
-        self.log_to_file = logging_section.getboolean('log_to_file')
+        self.log_to_file = _getbool(logging_section, 'log_to_file')
         self.log_file = logging_section.get('log_file')
+
+        # Resolve project-root-relative paths once instead of per call
+        if os.path.isabs(self.data_directory):
+            self._data_directory_path = Path(self.data_directory)
+        else:
+            self._data_directory_path = self.project_root / self.data_directory
+        self._log_file_path: Optional[Path] = None
+        if self.log_file:
+            log_path = Path(self.log_file)
+            self._log_file_path = log_path if log_path.is_absolute() else self.project_root / self.log_file
     
     def _validate_config(self):
         """Validate configuration values."""
@@ -118,14 +285,21 @@ class Config:
     
     def setup_logging(self):
         """Setup logging based on configuration."""
-        # Convert log level string to logging constant
-        log_level = getattr(logging, self.log_level)
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        # Idempotency guard: repeat calls would reinstall handlers and
+        # redo the cleanup scan for no benefit
+        if getattr(self, '_logging_configured', False):
+            return
+        self._logging_configured = True
+
+        # Skip per-record thread/process introspection the app never logs
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
+        # Convert log level string to logging constant via the lookup table
+        log_level = self._LEVELS[self.log_level]
+
+        formatter = self._FORMATTER
         
         # Setup console handler
         console_handler = logging.StreamHandler()
@@ -143,58 +317,63 @@ class Config:
         if self.log_to_file:
             try:
                 # Create logs directory if it doesn't exist
-                log_path = Path(self.log_file)
-                if not log_path.is_absolute():
-                    log_path = self.project_root / self.log_file
-                
-                log_dir = log_path.parent
+                log_dir = self._log_file_path.parent
                 log_dir.mkdir(parents=True, exist_ok=True)
-                
-                # Create timestamped log file for this run
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                timestamped_log = log_dir / f"guardian_monitor_{timestamp}.log"
-                
-                file_handler = logging.FileHandler(timestamped_log)
+
+                # Rotate at 5 MB keeping 9 backups (10 files total), which
+                # replaces the per-run timestamped file + cleanup scan
+                rotating_log = log_dir / "guardian_monitor.log"
+                file_handler = logging.handlers.RotatingFileHandler(
+                    rotating_log, maxBytes=5 * 1024 * 1024, backupCount=9
+                )
                 file_handler.setFormatter(formatter)
                 root_logger.addHandler(file_handler)
-                
-                logging.info(f"Logging to file: {timestamped_log}")
-                
-                # Clean up old log files (keep only 10 most recent)
-                self._cleanup_old_logs(log_dir)
-                
+
+                logging.info(f"Logging to file: {rotating_log}")
+
+                # One-shot migration: remove pre-existing timestamped logs
+                # from the old per-run naming scheme. Runs in a background
+                # thread so unlink latency doesn't block startup; the
+                # rotating handler never touches those file names
+                threading.Thread(
+                    target=self._cleanup_old_logs,
+                    args=(log_dir, 0),
+                    daemon=True,
+                ).start()
+
             except Exception as e:
                 logging.error(f"Failed to setup file logging: {e}")
     
     def _cleanup_old_logs(self, log_dir: Path, max_logs: int = 10):
         """Clean up old log files, keeping only the most recent ones."""
         try:
-            # Get all Guardian monitor log files
-            log_pattern = "guardian_monitor_*.log"
-            log_files = list(log_dir.glob(log_pattern))
-            
-            if len(log_files) <= max_logs:
+            # Scan the directory once; DirEntry.stat() reuses the data the
+            # OS already returned, avoiding a second stat per file
+            with os.scandir(log_dir) as it:
+                entries = [
+                    (entry.stat().st_mtime, entry.path, entry.name)
+                    for entry in it
+                    if entry.is_file() and entry.name.startswith('guardian_monitor_') and entry.name.endswith('.log')
+                ]
+
+            if len(entries) <= max_logs:
                 return  # No cleanup needed
-            
-            # Sort by modification time (newest first)
-            log_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-            
-            # Keep only the most recent max_logs files
-            files_to_keep = log_files[:max_logs]
-            files_to_delete = log_files[max_logs:]
-            
+
+            # Select the oldest files directly instead of fully sorting
+            files_to_delete = heapq.nsmallest(len(entries) - max_logs, entries, key=lambda e: e[0])
+
             # Delete old log files
             deleted_count = 0
-            for log_file in files_to_delete:
+            for _, path, name in files_to_delete:
                 try:
-                    log_file.unlink()
+                    os.unlink(path)
                     deleted_count += 1
                 except Exception as e:
-                    logging.warning(f"Failed to delete old log {log_file.name}: {e}")
-            
+                    logging.warning(f"Failed to delete old log {name}: {e}")
+
             if deleted_count > 0:
-                logging.info(f"Cleaned up {deleted_count} old log files, kept {len(files_to_keep)} most recent")
-                
+                logging.info(f"Cleaned up {deleted_count} old log files, kept {len(entries) - deleted_count} most recent")
+
         except Exception as e:
             logging.warning(f"Error during log cleanup: {e}")
     
@@ -205,11 +384,7 @@ class Config:
         Returns:
             Path object for data directory
         """
-        if os.path.isabs(self.data_directory):
-            return Path(self.data_directory)
-        else:
-            # Relative to project root
-            return self.project_root / self.data_directory
+        return self._data_directory_path
     
     def is_discord_configured(self) -> bool:
         """
@@ -227,7 +402,9 @@ class Config:
         Returns:
             Dictionary with configuration summary
         """
-        return {
+        if self._summary is not None:
+            return self._summary
+        self._summary = {
             'discord_configured': self.is_discord_configured(),
             'guardian_series_urls': self.guardian_series_urls,
             'send_error_notifications': self.send_error_notifications,
@@ -237,7 +414,8 @@ class Config:
             'request_timeout': self.request_timeout,
             'retry_attempts': self.retry_attempts
         }
-    
+        return self._summary
+
     def __str__(self) -> str:
         """String representation of configuration."""
         summary = self.get_summary()
@@ -4,7 +4,14 @@ Sends formatted notifications about new show recommendations to Discord.
 """
 
 from discord_webhook import DiscordEmbed, DiscordWebhook
+from collections import Counter, deque
+import functools
+import hashlib
 import os
+import re
+import time
+import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from typing import List, Dict, Optional
 import logging
@@ -14,34 +21,184 @@ from datetime import datetime
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=1)
+def _default_webhook_url() -> Optional[str]:
+    """
+    Resolve DISCORD_WEBHOOK_URL once per process. The .env scan and the
+    environ walk happen on the first call only; every later bot
+    construction gets the cached value. Tests that change the
+    environment can reset with _default_webhook_url.cache_clear().
+    """
+    if 'DISCORD_WEBHOOK_URL' not in os.environ:
+        # Try to load from project root
+        env_file = os.path.join(os.path.dirname(__file__), '..', '.env')
+        if os.path.exists(env_file):
+            load_dotenv(env_file)
+        else:
+            load_dotenv()  # Load from system environment
+    return os.environ.get('DISCORD_WEBHOOK_URL')
+
+# Month names so _format_date avoids a strptime/strftime round-trip
+_MONTHS = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December'
+)
+
+# Shape of a valid Discord webhook URL (including ptb/canary hosts and
+# the legacy discordapp.com domain), compiled once at import so
+# is_configured pays a single match call instead of a re-cache lookup
+_WEBHOOK_RE = re.compile(
+    r'^https://(?:ptb\.|canary\.)?discord(?:app)?\.com/api/webhooks/\d+/[A-Za-z0-9_-]+$'
+)
+
+# Webhook POSTs allowed per rolling minute. Discord caps webhooks at 30
+# requests/min; staying one under leaves headroom for retries
+_RATE_LIMIT_PER_MINUTE = 29
+
+# Embed constants hoisted out of the send methods
+GUARDIAN_BLUE = 0x052962
+ERROR_RED = 0xff0000
+SUCCESS_GREEN = 0x00ff00
+FOOTER_TEXT = "Guardian Seven Best Shows Monitor"
+FOOTER_ICON_URL = "https://assets.guim.co.uk/images/favicons/fee5e2d638d1c35f6d501fa397e53329/152x152.png"
+
+
+def _truncate(text: str, limit: int = 150, suffix: str = "...") -> str:
+    """Truncate text to limit characters, appending suffix if shortened."""
+    return text if len(text) <= limit else text[:limit - len(suffix)] + suffix
+
+
+def _show_field(index: int, show: Dict[str, str]) -> Dict[str, object]:
+    """Build one embed field dict for a show entry."""
+    # Unpack everything up front through one bound .get reference so the
+    # formatting below works on plain locals
+    get = show.get
+    title = get('title') or 'Unknown Show'
+    platform = get('platform') or 'Platform not specified'
+    description = _truncate(get('description') or 'No description available')
+    if get('pick_of_the_week', False):
+        title = f"⭐ {title} (Pick of the week)"
+    return {
+        'name': f"{index}. {title}",
+        'value': f"**Platform:** {platform}\n{description}",
+        'inline': False,
+    }
+
 class GuardianDiscordBot:
     """Discord bot for sending Guardian Seven Best Shows notifications."""
     
-    def __init__(self, env_path: Optional[str] = None):
+    def __init__(self, env_path: Optional[str] = None, session: Optional[requests.Session] = None):
         """
         Initialize Discord bot with webhook configuration.
-        
+
         Args:
             env_path: Path to .env file. Defaults to project root.
+            session: Shared requests.Session to reuse. A private pooled
+                session is created if not provided.
         """
-        # Load environment variables
+        # An explicit env_path bypasses the process-wide cache; the
+        # default path resolves the URL through _default_webhook_url so
+        # the .env scan happens at most once per process
         if env_path:
             load_dotenv(env_path)
+            self.webhook_url = os.getenv('DISCORD_WEBHOOK_URL')
         else:
-            # Try to load from project root
-            env_file = os.path.join(os.path.dirname(__file__), '..', '.env')
-            if os.path.exists(env_file):
-                load_dotenv(env_file)
-            else:
-                load_dotenv()  # Load from system environment
-        
-        self.webhook_url = os.getenv('DISCORD_WEBHOOK_URL')
-        
+            self.webhook_url = _default_webhook_url()
+
+        # Reuse one pooled HTTPS connection across notifications so each
+        # webhook POST doesn't pay a fresh TCP + TLS handshake
+        self._owns_session = session is None
+        if session is None:
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=2))
+        self._session = session
+
+        # Fingerprint of the last alert sent, used to skip duplicate POSTs
+        self._last_sent_hash: Optional[str] = None
+
+        # Buffered embeds while in batch mode (None = send immediately)
+        self._batch: Optional[List[DiscordEmbed]] = None
+
+        # Timestamps of recent POSTs backing the local token bucket, so
+        # bursts wait out the window instead of eating 429 retries
+        self._send_times: deque = deque(maxlen=_RATE_LIMIT_PER_MINUTE)
+
         if not self.webhook_url:
             logger.warning("DISCORD_WEBHOOK_URL not found in environment variables")
         else:
             logger.info("Discord webhook configured successfully")
     
+    def _execute_webhook(self, *embeds: DiscordEmbed) -> bool:
+        """
+        Send one or more embeds in a single payload through the shared
+        pooled session. Discord allows up to 10 embeds per message.
+
+        Args:
+            embeds: DiscordEmbeds to send in one POST
+
+        Returns:
+            True if Discord accepted the payload, False otherwise
+        """
+        if self._batch is not None:
+            # Batch mode: buffer for a single POST at flush() time
+            self._batch.extend(embeds)
+            return True
+        if not self.webhook_url:
+            logger.error("Cannot send Discord notification: webhook URL not configured")
+            return False
+        self._reserve_rate_limit_slot()
+        webhook = DiscordWebhook(url=self.webhook_url)
+        for embed in embeds[:10]:
+            webhook.add_embed(embed)
+        response = self._session.post(self.webhook_url, json=webhook.json, timeout=10)
+        return response.status_code in (200, 204)
+
+    def _reserve_rate_limit_slot(self) -> None:
+        """
+        Take one token from the local rate bucket, sleeping until the
+        rolling one-minute window has room. Cheaper than firing the POST
+        and paying Discord's 429 + Retry-After round trip.
+        """
+        now = time.monotonic()
+        while self._send_times and self._send_times[0] <= now - 60.0:
+            self._send_times.popleft()
+        if len(self._send_times) >= _RATE_LIMIT_PER_MINUTE:
+            wait = 60.0 - (now - self._send_times[0])
+            logger.warning(f"Discord rate budget exhausted; waiting {wait:.1f}s")
+            time.sleep(wait)
+            self._send_times.popleft()
+        self._send_times.append(time.monotonic())
+
+    def begin_batch(self) -> None:
+        """
+        Start buffering embeds instead of POSTing per send call. Each
+        Discord webhook POST accepts up to 10 embeds, so grouping the
+        main alert with e.g. a platform summary halves the round trips
+        and the rate-limit spend.
+        """
+        self._batch = []
+
+    def flush(self) -> bool:
+        """
+        Send everything buffered since begin_batch in as few POSTs as
+        possible (10 embeds per payload) and leave batch mode.
+
+        Returns:
+            True if Discord accepted every payload, False otherwise
+        """
+        batch, self._batch = self._batch, None
+        if not batch:
+            return True
+        return all(
+            self._execute_webhook(*batch[start:start + 10])
+            for start in range(0, len(batch), 10)
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP session if this bot owns it."""
+        if self._owns_session:
+            self._session.close()
+
     def send_new_shows_alert(self, article_title: str, article_date: str, 
                            article_url: str, shows: List[Dict[str, str]]) -> bool:
         """
@@ -56,16 +213,30 @@ class GuardianDiscordBot:
         Returns:
             True if successful, False otherwise
         """
+        if not shows:
+            logger.debug("No shows to report; skipping Discord webhook")
+            return True
+
         if not self.webhook_url:
             logger.error("Cannot send Discord notification: webhook URL not configured")
             return False
-        
+
+        # Skip the outbound POST entirely if this exact alert was already
+        # sent by this process (e.g. repeated monitor runs)
+        payload_hash = hashlib.blake2b(
+            (article_url + '|' + '|'.join(s.get('title', '') for s in shows)).encode(),
+            digest_size=8,
+        ).hexdigest()
+        if payload_hash == self._last_sent_hash:
+            logger.info("Identical alert already sent; skipping Discord webhook")
+            return True
+
         try:
             # Create main embed
             embed = DiscordEmbed(
                 title="🎬 New Guardian Show Recommendations!",
                 description=f"**{len(shows)} new shows** to stream this week from The Guardian",
-                color=0x052962,  # Guardian blue color
+                color=GUARDIAN_BLUE,
                 url=article_url
             )
             
@@ -86,58 +257,97 @@ class GuardianDiscordBot:
                 inline=False
             )
             
-            # Add shows (limit to prevent embed from being too long)
-            shows_to_display = shows[:7]  # Guardian typically has 7 shows
-            
-            for i, show in enumerate(shows_to_display, 1):
-                title = show.get('title', 'Unknown Show')
-                platform = show.get('platform', 'Platform not specified')
-                description = show.get('description', 'No description available')
-                pick_of_the_week = show.get('pick_of_the_week', False)
-                
-                # Add "Pick of the week" indicator to title if applicable
-                display_title = title
-                if pick_of_the_week:
-                    display_title = f"⭐ {title} (Pick of the week)"
-                
-                # Truncate description if too long
-                if len(description) > 150:
-                    description = description[:147] + "..."
-                
-                # Format show entry
-                show_text = f"**Platform:** {platform}\n{description}"
-                
-                embed.add_embed_field(
-                    name=f"{i}. {display_title}",
-                    value=show_text,
-                    inline=False
-                )
-            
-            # Add footer
-            embed.set_footer(
-                text="Guardian Seven Best Shows Monitor",
-                icon_url="https://assets.guim.co.uk/images/favicons/fee5e2d638d1c35f6d501fa397e53329/152x152.png"
+            # Add shows in one bulk extend instead of seven add_embed_field
+            # dispatches (limit to prevent a single embed from being too long)
+            embed.fields.extend(
+                _show_field(i, show) for i, show in enumerate(shows[:7], 1)
             )
-            
+
+            # Overflow shows (rare - Guardian typically has exactly 7) go
+            # into continuation embeds in the same webhook payload rather
+            # than being dropped or costing extra POSTs
+            embeds = [embed]
+            for start in range(7, len(shows), 7):
+                extra = DiscordEmbed(color=GUARDIAN_BLUE)
+                extra.fields.extend(
+                    _show_field(i, show)
+                    for i, show in enumerate(shows[start:start + 7], start + 1)
+                )
+                embeds.append(extra)
+
+            # Add footer to the last embed in the batch
+            embeds[-1].set_footer(text=FOOTER_TEXT, icon_url=FOOTER_ICON_URL)
+
             # Set timestamp
             embed.set_timestamp()
-            
-            # Send webhook
-            webhook = DiscordWebhook(url=self.webhook_url)
-            webhook.add_embed(embed)
-            response = webhook.execute()
-            
-            if response.status_code == 200:
+
+            # Send all embeds in one webhook POST
+            if self._execute_webhook(*embeds):
+                self._last_sent_hash = payload_hash
                 logger.info(f"Discord notification sent successfully for {len(shows)} shows")
                 return True
             else:
-                logger.error(f"Failed to send Discord notification. Status: {response.status_code}")
+                logger.error("Failed to send Discord notification")
                 return False
                 
         except Exception as e:
             logger.error(f"Error sending Discord notification: {e}")
             return False
     
+    def send_platform_summary(self, shows: List[Dict[str, str]], article_date: str) -> bool:
+        """
+        Send a summary of how many shows each platform received.
+
+        Args:
+            shows: List of show dictionaries
+            article_date: Publication date of the source article (YYYY-MM-DD)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.webhook_url:
+            logger.error("Cannot send Discord notification: webhook URL not configured")
+            return False
+
+        try:
+            # Counter aggregates at C speed and most_common gives the
+            # busiest platforms first
+            counts = Counter(
+                show.get('platform') or 'Platform not specified' for show in shows
+            )
+
+            embed = DiscordEmbed(
+                title="📊 Platform Summary",
+                description=f"Where this week's {len(shows)} shows are streaming",
+                color=GUARDIAN_BLUE
+            )
+
+            for platform, count in counts.most_common():
+                embed.add_embed_field(
+                    name=platform,
+                    value=f"{count} show{'s' if count != 1 else ''}",
+                    inline=True
+                )
+
+            embed.add_embed_field(
+                name="📅 Published",
+                value=self._format_date(article_date),
+                inline=False
+            )
+
+            embed.set_footer(text=FOOTER_TEXT, icon_url=FOOTER_ICON_URL)
+
+            if self._execute_webhook(embed):
+                logger.info(f"Platform summary sent for {len(counts)} platforms")
+                return True
+            else:
+                logger.error("Failed to send platform summary")
+                return False
+
+        except Exception as e:
+            logger.error(f"Error sending platform summary: {e}")
+            return False
+
     def send_error_notification(self, error_message: str, context: Optional[str] = None) -> bool:
         """
         Send error notification to Discord.
@@ -157,7 +367,7 @@ class GuardianDiscordBot:
             embed = DiscordEmbed(
                 title="⚠️ Guardian Monitor Error",
                 description="An error occurred while monitoring Guardian show recommendations",
-                color=0xff0000  # Red color for errors
+                color=ERROR_RED
             )
             
             embed.add_embed_field(
@@ -179,18 +389,14 @@ class GuardianDiscordBot:
                 inline=True
             )
             
-            embed.set_footer(text="Guardian Seven Best Shows Monitor - Error Alert")
-            
-            # Send webhook
-            webhook = DiscordWebhook(url=self.webhook_url)
-            webhook.add_embed(embed)
-            response = webhook.execute()
+            embed.set_footer(text=f"{FOOTER_TEXT} - Error Alert")
             
-            if response.status_code == 200:
+            # Send webhook through the shared session
+            if self._execute_webhook(embed):
                 logger.info("Error notification sent successfully")
                 return True
             else:
-                logger.error(f"Failed to send error notification. Status: {response.status_code}")
+                logger.error("Failed to send error notification")
                 return False
                 
         except Exception as e:
@@ -212,7 +418,7 @@ class GuardianDiscordBot:
             embed = DiscordEmbed(
                 title="🧪 Test Message",
                 description="Guardian Seven Best Shows Monitor is working correctly!",
-                color=0x00ff00  # Green color
+                color=SUCCESS_GREEN
             )
             
             embed.add_embed_field(
@@ -227,18 +433,14 @@ class GuardianDiscordBot:
                 inline=True
             )
             
-            embed.set_footer(text="Guardian Seven Best Shows Monitor - Test")
+            embed.set_footer(text=f"{FOOTER_TEXT} - Test")
             
-            # Send webhook
-            webhook = DiscordWebhook(url=self.webhook_url)
-            webhook.add_embed(embed)
-            response = webhook.execute()
-            
-            if response.status_code == 200:
+            # Send webhook through the shared session
+            if self._execute_webhook(embed):
                 logger.info("Test message sent successfully")
                 return True
             else:
-                logger.error(f"Failed to send test message. Status: {response.status_code}")
+                logger.error("Failed to send test message")
                 return False
                 
         except Exception as e:
@@ -255,20 +457,29 @@ class GuardianDiscordBot:
         Returns:
             Formatted date string
         """
+        # YYYY-MM-DD has a fixed shape, so slice it directly rather than
+        # paying for a datetime round-trip or even a regex match
+        if len(date_str) != 10 or date_str[4] != '-' or date_str[7] != '-':
+            return date_str  # Return original if parsing fails
         try:
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            return date_obj.strftime("%B %d, %Y")
+            month = int(date_str[5:7])
         except ValueError:
-            return date_str  # Return original if parsing fails
+            return date_str
+        # Bounds check before indexing: "00" would otherwise wrap to
+        # _MONTHS[-1] and silently render as December
+        if not 1 <= month <= 12:
+            return date_str
+        return f"{_MONTHS[month - 1]} {date_str[8:10]}, {date_str[:4]}"
     
     def is_configured(self) -> bool:
         """
         Check if Discord webhook is properly configured.
-        
+
         Returns:
-            True if webhook URL is available, False otherwise
+            True if a webhook URL with a valid Discord shape is
+            available, False otherwise
         """
-        return bool(self.webhook_url)
+        return bool(self.webhook_url and _WEBHOOK_RE.match(self.webhook_url))
 
 
 def main():
@@ -325,6 +536,7 @@ def main():
         print("❌ Failed to send new shows alert")
     
     print("🎉 Discord integration test completed!")
+    bot.close()
 
 
 if __name__ == "__main__":
@@ -5,97 +5,136 @@ Log Management Utility for Guardian Seven Best Shows Monitor
 Provides commands to manage log files including cleanup and status.
 """
 
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
 import logging
 
+# The RotatingFileHandler keeps the active log plus this many numbered
+# backups (guardian_monitor.log.1 ... .9), ten files total
+MAX_ROTATED_LOGS = 10
+
+ACTIVE_LOG_NAME = "guardian_monitor.log"
+
+
+def _is_rotating_log(name: str) -> bool:
+    """True for the active rotating log or one of its numbered backups."""
+    if name == ACTIVE_LOG_NAME:
+        return True
+    prefix = ACTIVE_LOG_NAME + '.'
+    return name.startswith(prefix) and name[len(prefix):].isdigit()
+
+
+def _is_legacy_log(name: str) -> bool:
+    """True for leftover logs from the old per-run timestamped scheme."""
+    return name.startswith('guardian_monitor_') and name.endswith('.log')
+
+
 class LogManager:
     def __init__(self, log_dir: str = "logs"):
         """Initialize the log manager."""
         self.log_dir = Path(log_dir)
-        self.log_pattern = "guardian_monitor_*.log"
-    
+
     def show_log_status(self) -> None:
         """Show status of log files."""
         try:
-            log_files = list(self.log_dir.glob(self.log_pattern))
-            
+            # One scandir pass: mtime and size come from the cached
+            # DirEntry stat, so no file is stat'ed more than once
+            entries = self._scan_log_entries()
+
             print("=== Guardian Monitor Log Files Status ===")
             print(f"Log directory: {self.log_dir}")
-            print(f"Total log files: {len(log_files)}")
-            
-            if not log_files:
+            print(f"Total log files: {len(entries)}")
+
+            if not entries:
                 print("No log files found")
                 return
-            
-            # Sort by modification time (newest first)
-            log_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-            
+
+            # Sort by modification time (newest first) - plain numeric
+            # tuples, so no key callback per comparison
+            entries.sort(reverse=True)
+
             # Calculate total size
-            total_size = sum(f.stat().st_size for f in log_files)
+            total_size = sum(size for _, size, _, _ in entries)
             total_size_mb = total_size / (1024 * 1024)
-            
+
             print(f"Total size: {total_size_mb:.2f} MB")
-            print(f"Max logs kept: 10")
-            
-            if len(log_files) > 10:
-                print(f"⚠️  {len(log_files) - 10} old log files can be cleaned up")
+            print(f"Max logs kept by rotation: {MAX_ROTATED_LOGS}")
+
+            legacy_count = sum(1 for _, _, _, name in entries if _is_legacy_log(name))
+            if legacy_count:
+                print(f"⚠️  {legacy_count} leftover file(s) from the old naming scheme can be cleaned up")
             else:
-                print("✅ Log count within limit")
-            
+                print("✅ Log count capped by rotation")
+
             print("\nRecent log files:")
-            for i, log_file in enumerate(log_files[:5]):  # Show 5 most recent
-                size_kb = log_file.stat().st_size / 1024
-                mtime = datetime.fromtimestamp(log_file.stat().st_mtime)
-                print(f"  {i+1}. {log_file.name} ({size_kb:.1f} KB, {mtime.strftime('%Y-%m-%d %H:%M:%S')})")
-            
-            if len(log_files) > 5:
-                print(f"  ... and {len(log_files) - 5} more")
-                
+            for i, (mtime, size, _, name) in enumerate(entries[:5]):  # Show 5 most recent
+                size_kb = size / 1024
+                mtime_str = datetime.fromtimestamp(mtime).strftime('%Y-%m-%d %H:%M:%S')
+                print(f"  {i+1}. {name} ({size_kb:.1f} KB, {mtime_str})")
+
+            if len(entries) > 5:
+                print(f"  ... and {len(entries) - 5} more")
+
         except Exception as e:
             print(f"Error showing log status: {e}")
-    
-    def cleanup_logs(self, max_logs: int = 10) -> None:
-        """Clean up old log files."""
+
+    def _scan_log_entries(self) -> list:
+        """
+        Scan the log directory once with os.scandir.
+
+        Returns:
+            List of (mtime, size, path, name) tuples covering the active
+            rotating log, its numbered backups, and any leftover
+            timestamped logs from the pre-rotation naming scheme
+        """
+        entries = []
+        with os.scandir(self.log_dir) as it:
+            for entry in it:
+                if entry.is_file() and (_is_rotating_log(entry.name) or _is_legacy_log(entry.name)):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path, entry.name))
+        return entries
+
+    def cleanup_logs(self) -> None:
+        """
+        Remove leftover logs from the old per-run naming scheme.
+
+        The RotatingFileHandler already caps guardian_monitor.log and its
+        numbered backups at ten files, so the only thing left to clean is
+        timestamped files a pre-rotation version wrote.
+        """
         try:
-            log_files = list(self.log_dir.glob(self.log_pattern))
-            
+            files_to_delete = [
+                e for e in self._scan_log_entries() if _is_legacy_log(e[3])
+            ]
+
             print("=== Cleaning Up Old Log Files ===")
-            print(f"Found {len(log_files)} log files")
-            
-            if len(log_files) <= max_logs:
-                print(f"✅ Only {len(log_files)} files found, no cleanup needed (max: {max_logs})")
+
+            if not files_to_delete:
+                print("✅ No leftover logs from the old naming scheme; rotation caps the rest")
                 return
-            
-            # Sort by modification time (newest first)
-            log_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-            
-            files_to_keep = log_files[:max_logs]
-            files_to_delete = log_files[max_logs:]
-            
-            print(f"Keeping {len(files_to_keep)} most recent files")
-            print(f"Deleting {len(files_to_delete)} old files:")
-            
+
+            print(f"Deleting {len(files_to_delete)} leftover file(s):")
+
             deleted_count = 0
             freed_space = 0
-            
-            for log_file in files_to_delete:
+
+            for _, file_size, path, name in files_to_delete:
                 try:
-                    file_size = log_file.stat().st_size
-                    log_file.unlink()
+                    os.unlink(path)
                     deleted_count += 1
                     freed_space += file_size
-                    print(f"  ✅ Deleted: {log_file.name}")
+                    print(f"  ✅ Deleted: {name}")
                 except Exception as e:
-                    print(f"  ❌ Failed to delete {log_file.name}: {e}")
-            
+                    print(f"  ❌ Failed to delete {name}: {e}")
+
             freed_space_mb = freed_space / (1024 * 1024)
             print(f"\n🎉 Cleanup complete:")
             print(f"   Deleted: {deleted_count} files")
             print(f"   Freed space: {freed_space_mb:.2f} MB")
-            print(f"   Remaining: {len(files_to_keep)} log files")
-            
+
         except Exception as e:
             print(f"Error during log cleanup: {e}")
 
@@ -105,12 +144,12 @@ def main():
     if len(sys.argv) < 2:
         print("Usage:")
         print("  python log_manager.py status   # Show log files status")
-        print("  python log_manager.py cleanup  # Clean up old log files")
+        print("  python log_manager.py cleanup  # Clean up leftover old-style log files")
         return
-    
+
     command = sys.argv[1].lower()
     manager = LogManager()
-    
+
     if command == "status":
         manager.show_log_status()
     elif command == "cleanup":
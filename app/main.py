@@ -7,51 +7,79 @@ Designed to run as a single execution (e.g., via cron job).
 
 import sys
 import time
-import argparse
 import logging
-from datetime import datetime
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 from typing import Optional, List, Dict, Any
 
-from .config import config
-from .scraper import GuardianScraper
-from .storage import ShowDataStorage
-from .discord_bot import GuardianDiscordBot
+from .config import get_config
 
-# Import qBittorrent rules manager
-try:
-    from .qbittorrent_rules import QBittorrentRulesManager
-    QBITTORRENT_AVAILABLE = True
-except ImportError:
-    QBITTORRENT_AVAILABLE = False
+# The component modules (and their transitive requests/bs4/discord_webhook
+# dependencies) are imported lazily in GuardianMonitor.__init__ so fast CLI
+# paths like --config don't pay their cold-start cost.
 
 class GuardianMonitor:
     """Main application class that orchestrates all components."""
     
     def __init__(self):
         """Initialize the Guardian monitor with all components."""
+        # Heavy imports deferred to here so --config never loads them
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        from .scraper import GuardianScraper
+        from .storage import ShowDataStorage
+        from .discord_bot import GuardianDiscordBot
+
+        try:
+            from .qbittorrent_rules import QBittorrentRulesManager
+            qbittorrent_available = True
+        except ImportError:
+            qbittorrent_available = False
+
+        # Load configuration lazily - first access parses config.ini/.env
+        self.config = config = get_config()
+
+        # Warm the resolver cache for the hosts we are about to hit so the
+        # first HTTPS call doesn't stall on DNS; runs while logging and
+        # component construction proceed
+        threading.Thread(target=self._warm_dns, daemon=True).start()
+
         # Setup logging first
         config.setup_logging()
         self.logger = logging.getLogger(__name__)
         
-        # Log configuration summary
+        # Log configuration summary - the isEnabledFor guard means the
+        # summary dict is never built when INFO is filtered out (get_summary
+        # is memoized, so get_status reuses the same dict when it does run)
         self.logger.info("Starting Guardian Seven Best Shows Monitor")
-        self.logger.info(f"Configuration: {config.get_summary()}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Configuration: %s", config.get_summary())
         
         # Initialize components
         try:
+            # One pooled session shared by scraper and Discord bot so
+            # keep-alive connections are reused across components. Retries
+            # stay with the scraper's own retry loop to avoid doubling up.
+            self.http = requests.Session()
+            self.http.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+
             self.scraper = GuardianScraper(
                 series_urls=config.guardian_series_urls,
                 timeout=config.request_timeout,
                 user_agent=config.user_agent,
                 retry_attempts=config.retry_attempts,
-                retry_delay=config.retry_delay
+                retry_delay=config.retry_delay,
+                session=self.http
             )
             self.storage = ShowDataStorage(data_dir=str(config.get_data_directory_path()))
-            self.discord_bot = GuardianDiscordBot() if config.is_discord_configured() else None
+            self.discord_bot = GuardianDiscordBot(session=self.http) if config.is_discord_configured() else None
             
             # Initialize qBittorrent rules manager if available
             self.qbt_manager = None
-            if QBITTORRENT_AVAILABLE:
+            if qbittorrent_available:
                 self.qbt_manager = QBittorrentRulesManager()
                 self.logger.info("qBittorrent rules manager initialized")
             else:
@@ -63,9 +91,22 @@ class GuardianMonitor:
             self.logger.info("All components initialized successfully")
             
         except Exception as e:
-            self.logger.error(f"Failed to initialize components: {e}")
+            self.logger.error("Failed to initialize components: %s", e)
             raise
-    
+
+    def _warm_dns(self) -> None:
+        """Resolve upcoming hostnames in the background to hide DNS latency."""
+        hosts = {urlparse(url).hostname for url in self.config.guardian_series_urls}
+        if self.config.is_discord_configured():
+            hosts.add('discord.com')
+        for host in hosts:
+            if not host:
+                continue
+            try:
+                socket.getaddrinfo(host, 443)
+            except OSError:
+                pass  # The real request will surface (and retry) the failure
+
     def check_for_new_shows(self) -> bool:
         """
         Check for new Guardian show recommendations and process them.
@@ -76,74 +117,97 @@ class GuardianMonitor:
         try:
             self.logger.info("Checking for new Guardian show recommendations...")
             
-            # Get all articles from all series
-            articles = self.scraper.get_series_articles()
+            # Get all articles from all series, using cached HTTP validators
+            # so an unchanged index costs a 304 instead of a full download
+            articles = self.scraper.get_series_articles(
+                validators=self.storage.get_index_validators()
+            )
+            if self.scraper.index_unchanged:
+                self.logger.info("Guardian series index unchanged since last check (HTTP 304)")
+                return False
             if not articles:
                 self.logger.warning("No articles found in Guardian series")
                 return False
             
-            self.logger.info(f"Found {len(articles)} articles across all series")
-            
+            self.logger.info("Found %d articles across all series", len(articles))
+
+            # Collect unprocessed articles, then fetch and parse their show
+            # pages concurrently - the work is I/O-bound, so overlapping the
+            # article downloads collapses N sequential round-trips
+            new_articles = [a for a in articles if not self.storage.is_article_processed(a['url'])]
+            shows_by_url = self.scraper.parse_many([a['url'] for a in new_articles])
+
             # Process all unprocessed articles
             processed_count = 0
-            for article in articles:
-                if self.storage.is_article_processed(article['url']):
-                    continue
-                
-                self.logger.info(f"New article: {article['title']} ({article['date']})")
-                
-                shows = self.scraper.parse_show_recommendations(article['url'])
+            for article in new_articles:
+                self.logger.info("New article: %s (%s)", article['title'], article['date'])
+
+                shows = shows_by_url.get(article['url'], [])
                 if not shows:
-                    self.logger.warning(f"No shows found in: {article['title']}")
+                    self.logger.warning("No shows found in: %s", article['title'])
                     continue
                 
-                self.logger.info(f"Found {len(shows)} shows to process")
-                
-                # Save to storage
+                self.logger.info("Found %d shows to process", len(shows))
+
+                # Commit to storage before notifying: a failed save is
+                # retried on the next run, and that retry would re-send
+                # the alert if the webhook had already fired
                 if not self._save_shows_data(article, shows):
-                    self.logger.error(f"Failed to save shows data for: {article['title']}")
+                    self.logger.error("Failed to save shows data for: %s", article['title'])
                     continue
-                
-                # Send Discord notification
-                if self.discord_bot:
-                    if not self._send_discord_notifications(article, shows):
-                        self.logger.error("Failed to send Discord notifications")
+
+                notified = (
+                    self._send_discord_notifications(article, shows)
+                    if self.discord_bot else True
+                )
+
+                if not notified:
+                    self.logger.error("Failed to send Discord notifications")
                 
                 # Create qBittorrent rules
                 if self.qbt_manager:
                     try:
                         self._manage_qbittorrent_rules(shows)
                     except Exception as e:
-                        self.logger.error(f"Failed to manage qBittorrent rules: {e}")
-                        if self.discord_bot and config.send_error_notifications:
+                        self.logger.error("Failed to manage qBittorrent rules: %s", e)
+                        if self.discord_bot and self.config.send_error_notifications:
                             try:
                                 self.discord_bot.send_error_notification(
                                     f"qBittorrent rules error: {str(e)}",
                                     "Error occurred while managing qBittorrent download rules"
                                 )
                             except Exception as discord_error:
-                                self.logger.error(f"Failed to send qBittorrent error notification: {discord_error}")
+                                self.logger.error("Failed to send qBittorrent error notification: %s", discord_error)
                 
                 processed_count += 1
             
             if processed_count > 0:
-                self.logger.info(f"Successfully processed {processed_count} new article(s)")
+                self.logger.info("Successfully processed %d new article(s)", processed_count)
             else:
                 self.logger.info("No new articles to process")
+
+            # Persist fresh validators only when every new article was
+            # fully processed. A parse or save failure leaves the stale
+            # validators in place, so the next run re-fetches the index
+            # and retries the article instead of 304-skipping it until
+            # the Guardian page next changes
+            if self.scraper.index_validators and processed_count == len(new_articles):
+                self.storage.set_index_validators(self.scraper.index_validators)
+
             return processed_count > 0
             
         except Exception as e:
-            self.logger.error(f"Error checking for new shows: {e}")
+            self.logger.error("Error checking for new shows: %s", e)
             
             # Send error notification if configured
-            if self.discord_bot and config.send_error_notifications:
+            if self.discord_bot and self.config.send_error_notifications:
                 try:
                     self.discord_bot.send_error_notification(
                         str(e),
                         "Error occurred while checking for new Guardian show recommendations"
                     )
                 except Exception as discord_error:
-                    self.logger.error(f"Failed to send error notification: {discord_error}")
+                    self.logger.error("Failed to send error notification: %s", discord_error)
             
             return False
     
@@ -159,39 +223,17 @@ class GuardianMonitor:
             True if successful, False otherwise
         """
         try:
-            # Save shows data
-            success = self.storage.save_shows_data(
+            # One transactional entry point covering history, processed
+            # list, and last-checked marker
+            return self.storage.commit_article(
                 article['url'],
                 article['title'],
                 article['date'],
                 shows
             )
-            
-            if not success:
-                return False
-            
-            # Add to processed articles
-            success = self.storage.add_processed_article(
-                article['url'],
-                article['title'],
-                article['date'],
-                len(shows)
-            )
-            
-            if not success:
-                return False
-            
-            # Update last checked
-            success = self.storage.update_last_checked_article(
-                article['url'],
-                article['title'],
-                article['date']
-            )
-            
-            return success
-            
+
         except Exception as e:
-            self.logger.error(f"Error saving shows data: {e}")
+            self.logger.error("Error saving shows data: %s", e)
             return False
     
     def _manage_qbittorrent_rules(self, shows: List[Dict[str, str]]) -> None:
@@ -216,15 +258,15 @@ class GuardianMonitor:
                 matches = self.qbt_manager.check_existing_rules(title, existing_rules)
                 if not matches:  # No exact match found
                     shows_needing_rules.append(show)
-                    self.logger.info(f"Show needs qBittorrent rule: {title}")
+                    self.logger.info("Show needs qBittorrent rule: %s", title)
                 else:
-                    self.logger.info(f"Show already has qBittorrent rule: {title}")
+                    self.logger.info("Show already has qBittorrent rule: %s", title)
             
             if not shows_needing_rules:
                 self.logger.info("All shows already have qBittorrent rules")
                 return
             
-            self.logger.info(f"Creating qBittorrent rules for {len(shows_needing_rules)} shows")
+            self.logger.info("Creating qBittorrent rules for %d shows", len(shows_needing_rules))
             
             # Check if qBittorrent is running and close it if needed
             was_running = self.qbt_manager.is_qbittorrent_running()
@@ -235,7 +277,7 @@ class GuardianMonitor:
             
             # Create backup
             backup_file = self.qbt_manager.backup_rules()
-            self.logger.info(f"Created backup: {backup_file}")
+            self.logger.info("Created backup: %s", backup_file)
             
             # Add new rules
             new_rules = existing_rules.copy()
@@ -247,11 +289,11 @@ class GuardianMonitor:
                 rule = self.qbt_manager.create_rule_template(title, platform)
                 new_rules[title] = rule
                 created_count += 1
-                self.logger.info(f"Created rule for: {title} ({platform})")
+                self.logger.info("Created rule for: %s (%s)", title, platform)
             
             # Save the updated rules
             self.qbt_manager.save_rules(new_rules)
-            self.logger.info(f"Successfully added {created_count} new qBittorrent rules")
+            self.logger.info("Successfully added %d new qBittorrent rules", created_count)
             
             # Restart qBittorrent if it was running
             if was_running:
@@ -262,7 +304,7 @@ class GuardianMonitor:
                     self.logger.warning("Failed to restart qBittorrent - please start manually")
             
         except Exception as e:
-            self.logger.error(f"Error managing qBittorrent rules: {e}")
+            self.logger.error("Error managing qBittorrent rules: %s", e)
             # Try to restart qBittorrent if we closed it
             if was_running:
                 try:
@@ -294,18 +336,25 @@ class GuardianMonitor:
             return success
             
         except Exception as e:
-            self.logger.error(f"Error sending Discord notifications: {e}")
+            self.logger.error("Error sending Discord notifications: %s", e)
             return False
     
     def run(self) -> bool:
         """
         Run a single check for new shows.
-        
+
         Returns:
             True if new shows were found, False otherwise
         """
         self.logger.info("Running check for new shows")
-        return self.check_for_new_shows()
+        try:
+            return self.check_for_new_shows()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Close the shared HTTP session."""
+        self.http.close()
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -322,14 +371,16 @@ class GuardianMonitor:
             last_checked = self.storage.get_last_checked_article()
             
             status = {
-                'timestamp': datetime.now().isoformat(),
+                # time.strftime skips the datetime allocation and drops the
+                # microsecond precision nothing consumes
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime()),
                 'components': {
                     'scraper': 'initialized',
                     'storage': 'initialized',
                     'discord': 'configured' if self.discord_bot else 'not configured',
                     'qbittorrent': 'available' if self.qbt_manager else 'not available'
                 },
-                'configuration': config.get_summary(),
+                'configuration': self.config.get_summary(),
                 'storage': {
                     'processed_articles': storage_stats['processed_articles_count'],
                     'history_entries': storage_stats['shows_history_entries'],
@@ -359,7 +410,7 @@ class GuardianMonitor:
             return status
             
         except Exception as e:
-            self.logger.error(f"Error getting status: {e}")
+            self.logger.error("Error getting status: %s", e)
             return {'error': str(e)}
     
     def test_components(self) -> bool:
@@ -370,26 +421,33 @@ class GuardianMonitor:
             True if all tests pass, False otherwise
         """
         self.logger.info("Testing all components...")
-        
+
         try:
-            # Test scraper
+            # The scraper and Discord probes hit independent hosts, so run
+            # them concurrently and overlap the two network round-trips
             self.logger.info("Testing scraper...")
-            articles = self.scraper.get_series_articles()
+            discord_future = None
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                scraper_future = executor.submit(self.scraper.get_series_articles)
+                if self.discord_bot:
+                    self.logger.info("Testing Discord...")
+                    discord_future = executor.submit(self.discord_bot.send_test_message)
+
+                # Test storage locally while the network probes are in flight
+                self.logger.info("Testing storage...")
+                stats = self.storage.get_storage_stats()
+                self.logger.info("✅ Storage test passed - %s processed articles", stats['processed_articles_count'])
+
+                articles = scraper_future.result()
+
             if not articles:
                 self.logger.error("Scraper test failed - no articles found")
                 return False
-            self.logger.info(f"✅ Scraper test passed - found {len(articles)} articles")
-            
-            # Test storage
-            self.logger.info("Testing storage...")
-            stats = self.storage.get_storage_stats()
-            self.logger.info(f"✅ Storage test passed - {stats['processed_articles_count']} processed articles")
-            
-            # Test Discord (if configured)
-            if self.discord_bot:
-                self.logger.info("Testing Discord...")
-                success = self.discord_bot.send_test_message()
-                if success:
+            self.logger.info("✅ Scraper test passed - found %d articles", len(articles))
+
+            # Collect Discord result (if configured)
+            if discord_future is not None:
+                if discord_future.result():
                     self.logger.info("✅ Discord test passed - test message sent")
                 else:
                     self.logger.error("Discord test failed - could not send test message")
@@ -401,12 +459,92 @@ class GuardianMonitor:
             return True
             
         except Exception as e:
-            self.logger.error(f"Component test failed: {e}")
+            self.logger.error("Component test failed: %s", e)
+            return False
+
+
+def fast_path_unchanged() -> bool:
+    """
+    Cheap steady-state probe run before any component is constructed.
+
+    Issues stdlib HEAD requests against the configured series index pages
+    using the ETag/Last-Modified validators persisted by the last complete
+    run. When every page answers 304 Not Modified there is nothing new, so
+    the cron tick can exit without importing requests/bs4/discord_webhook
+    or touching JSON storage.
+
+    Returns:
+        True only when every series index reports 304; any missing
+        validator, non-304 answer, or error falls through to a full check.
+    """
+    import json
+    import urllib.error
+    import urllib.request
+
+    try:
+        config = get_config()
+        validators_file = config.get_data_directory_path() / "index_validators.json"
+        validators = json.loads(validators_file.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return False
+
+    urls = config.guardian_series_urls
+    user_agent = config.user_agent
+    if not urls or not user_agent or not isinstance(validators, dict):
+        return False
+
+    for url in urls:
+        validator = validators.get(url)
+        if not isinstance(validator, dict):
             return False
+        headers = {'User-Agent': user_agent}
+        if validator.get('etag'):
+            headers['If-None-Match'] = validator['etag']
+        if validator.get('last_modified'):
+            headers['If-Modified-Since'] = validator['last_modified']
+        if len(headers) == 1:
+            return False
+
+        request = urllib.request.Request(url, method='HEAD', headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=config.request_timeout):
+                return False  # 200 - the index changed
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                return False
+        except Exception:
+            return False  # Network trouble - let the full path handle retries
+
+    return True
 
 
 def main():
     """Main entry point."""
+    # Cron hot path: a zero-argument invocation never needs argparse, so
+    # skip ArgumentParser construction and go straight to the check.
+    # Outcome lines go through lazy %-style logging rather than print:
+    # under the default WARNING threshold neither the formatting nor the
+    # stdout write happens, keeping scheduled runs silent
+    if len(sys.argv) == 1:
+        log = logging.getLogger(__name__)
+        try:
+            if fast_path_unchanged():
+                log.info("No new shows found (index unchanged)")
+                return
+            found_new = GuardianMonitor().run()
+            if found_new:
+                log.info("New shows found and processed")
+            else:
+                log.info("No new shows found")
+        except KeyboardInterrupt:
+            print("\n👋 Monitor stopped by user")
+        except Exception as e:
+            logging.error("Fatal error: %s", e)
+            sys.exit(1)
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(description="Guardian Seven Best Shows Monitor")
     parser.add_argument('--test', action='store_true', help='Test all components')
     parser.add_argument('--status', action='store_true', help='Show current status')
@@ -417,24 +555,28 @@ def main():
     try:
         # Show configuration if requested
         if args.config:
-            print(config)
+            print(get_config())
             return
         
+        # Steady-state fast path: skip component construction entirely
+        # when the series indexes report 304 against stored validators
+        if not (args.status or args.test) and fast_path_unchanged():
+            print("ℹ️  No new shows found (index unchanged)")
+            return
+
         # Initialize monitor
         monitor = GuardianMonitor()
-        
+
         # Show status if requested
         if args.status:
+            import json
+
             status = monitor.get_status()
-            print("Guardian Seven Best Shows Monitor Status:")
-            print("=" * 45)
-            for key, value in status.items():
-                if isinstance(value, dict):
-                    print(f"{key}:")
-                    for sub_key, sub_value in value.items():
-                        print(f"  {sub_key}: {sub_value}")
-                else:
-                    print(f"{key}: {value}")
+            # One C-accelerated serialization pass and one write per chunk
+            # instead of a print call per status line
+            sys.stdout.write("Guardian Seven Best Shows Monitor Status:\n" + "=" * 45 + "\n")
+            json.dump(status, sys.stdout, indent=2, default=str)
+            sys.stdout.write("\n")
             return
         
         # Test components if requested
@@ -452,7 +594,7 @@ def main():
     except KeyboardInterrupt:
         print("\n👋 Monitor stopped by user")
     except Exception as e:
-        logging.error(f"Fatal error: {e}")
+        logging.error("Fatal error: %s", e)
         sys.exit(1)
 
 
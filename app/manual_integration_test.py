@@ -4,183 +4,280 @@ Integration test for Guardian Seven Best Shows Monitor.
 Tests the complete workflow: scraping -> storage -> Discord notification.
 """
 
+import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import requests
+from requests.adapters import HTTPAdapter, Retry
 from .scraper import GuardianScraper
 from .storage import ShowDataStorage
 from .discord_bot import GuardianDiscordBot
 
-def test_complete_workflow():
+def _build_shared_session() -> requests.Session:
+    """
+    Build one pooled session for the whole workflow so the Guardian
+    fetches and the Discord webhook reuse kept-alive connections instead
+    of paying a TCP + TLS handshake per request.
+    """
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ))
+    return session
+
+def _emit(lines):
+    """
+    Flush buffered output lines in one write() call. Under `python -u`
+    (the usual container/CI setup) every print is a syscall; batching a
+    section's lines cuts that to one write per step.
+    """
+    sys.stdout.write('\n'.join(lines) + '\n')
+    lines.clear()
+
+def test_complete_workflow(send_discord=False):
     """Test the complete workflow without sending Discord notifications."""
-    print("🧪 Testing Complete Workflow (without Discord)")
-    print("=" * 50)
-    
-    # Initialize components
-    scraper = GuardianScraper()
+    out = []
+    out.append("🧪 Testing Complete Workflow (without Discord)")
+    out.append("=" * 50)
+
+    # Initialize components around a single shared connection pool
+    session = _build_shared_session()
+    scraper = GuardianScraper(session=session)
     storage = ShowDataStorage()
-    discord_bot = GuardianDiscordBot()
-    
-    print("✅ Components initialized")
-    
-    # Step 1: Get articles from Guardian
-    print("\n📰 Step 1: Fetching Guardian articles...")
-    articles = scraper.get_series_articles()
-    
+    discord_bot = GuardianDiscordBot(session=session)
+
+    out.append("✅ Components initialized")
+    _emit(out)
+
+    # Step 1: Get articles from Guardian, sending the cached HTTP
+    # validators so unchanged index pages come back 304 with the cached
+    # article list instead of a full download + parse (the >95% case on
+    # an hourly cron). The local storage/config reads have no dependency
+    # on the fetch, so they run in the pool and their disk work hides
+    # behind the network round trip.
+    out.append("\n📰 Step 1: Fetching Guardian articles...")
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        articles_future = pool.submit(
+            scraper.get_series_articles,
+            validators=storage.get_index_validators(),
+        )
+        last_checked_future = pool.submit(storage.get_last_checked_article)
+        configured_future = pool.submit(discord_bot.is_configured)
+
+        articles = articles_future.result()
+        last_checked = last_checked_future.result()
+        discord_configured = configured_future.result()
+
+    # An all-304 pass is the success case, not a failure: the article
+    # cache behind it is in-memory only, so in a fresh process articles
+    # comes back empty even though nothing is wrong. Check it before the
+    # no-articles failure path or back-to-back runs would exit 1.
+    if scraper.index_unchanged:
+        out.append("ℹ️  Index pages unchanged since last check (304) - nothing new to process")
+        _emit(out)
+        return True
+
     if not articles:
-        print("❌ No articles found")
+        out.append("❌ No articles found")
+        _emit(out)
         return False
-    
-    print(f"✅ Found {len(articles)} articles")
+
+    out.append(f"✅ Found {len(articles)} articles")
     latest_article = articles[0]
-    print(f"   Latest: {latest_article['title']} ({latest_article['date']})")
-    
+    out.append(f"   Latest: {latest_article['title']} ({latest_article['date']})")
+    _emit(out)
+
     # Step 2: Check if article is already processed
-    print("\n💾 Step 2: Checking storage...")
+    out.append("\n💾 Step 2: Checking storage...")
     is_processed = storage.is_article_processed(latest_article['url'])
-    
+
     if is_processed:
-        print("ℹ️  Article already processed - would skip in real run")
-        
-        # Show what's in storage
-        last_checked = storage.get_last_checked_article()
+        out.append("ℹ️  Article already processed - would skip in real run")
+
+        # Show what's in storage (prefetched alongside the HTTP call)
         if last_checked:
-            print(f"   Last checked: {last_checked['title']}")
-        
+            out.append(f"   Last checked: {last_checked['title']}")
+
         stats = storage.get_storage_stats()
-        print(f"   Storage stats: {stats['processed_articles_count']} articles, {stats['shows_history_entries']} history entries")
-        
+        out.append(f"   Storage stats: {stats['processed_articles_count']} articles, {stats['shows_history_entries']} history entries")
+        _emit(out)
+
+        # Nothing left to process, so the fresh validators are safe to keep
+        if scraper.index_validators:
+            storage.set_index_validators(scraper.index_validators)
+
         return True
     else:
-        print("✅ Article not yet processed - would process in real run")
-    
+        out.append("✅ Article not yet processed - would process in real run")
+        _emit(out)
+
     # Step 3: Parse shows from article
-    print("\n🎬 Step 3: Parsing shows from article...")
+    out.append("\n🎬 Step 3: Parsing shows from article...")
     shows = scraper.parse_show_recommendations(latest_article['url'])
-    
+
     if not shows:
-        print("❌ No shows found in article")
+        out.append("❌ No shows found in article")
+        _emit(out)
         return False
-    
-    print(f"✅ Found {len(shows)} shows:")
-    for i, show in enumerate(shows[:3], 1):
-        print(f"   {i}. {show['title']} ({show['platform']})")
-    if len(shows) > 3:
-        print(f"   ... and {len(shows) - 3} more")
-    
-    # Step 4: Save to storage
-    print("\n💾 Step 4: Saving to storage...")
-    
-    # Save shows data
-    success = storage.save_shows_data(
-        latest_article['url'],
-        latest_article['title'],
-        latest_article['date'],
-        shows
-    )
-    
-    if not success:
-        print("❌ Failed to save shows data")
-        return False
-    
-    # Add to processed articles
-    success = storage.add_processed_article(
-        latest_article['url'],
-        latest_article['title'],
-        latest_article['date'],
-        len(shows)
-    )
-    
-    if not success:
-        print("❌ Failed to add processed article")
-        return False
-    
-    # Update last checked
-    success = storage.update_last_checked_article(
-        latest_article['url'],
-        latest_article['title'],
-        latest_article['date']
+
+    out.append(f"✅ Found {len(shows)} shows:")
+    # islice previews the first three without copying them into a new list
+    out.extend(
+        f"   {i}. {show['title']} ({show['platform']})"
+        for i, show in enumerate(islice(shows, 3), 1)
     )
-    
-    if not success:
-        print("❌ Failed to update last checked")
-        return False
-    
-    print("✅ Data saved successfully")
-    
+    if len(shows) > 3:
+        out.append(f"   ... and {len(shows) - 3} more")
+    _emit(out)
+
+    # Step 4: Save to storage - one transaction, one flush per file
+    out.append("\n💾 Step 4: Saving to storage...")
+
+    with storage.transaction():
+        # Save shows data
+        success = storage.save_shows_data(
+            latest_article['url'],
+            latest_article['title'],
+            latest_article['date'],
+            shows
+        )
+
+        if not success:
+            out.append("❌ Failed to save shows data")
+            _emit(out)
+            return False
+
+        # Add to processed articles
+        success = storage.add_processed_article(
+            latest_article['url'],
+            latest_article['title'],
+            latest_article['date'],
+            len(shows)
+        )
+
+        if not success:
+            out.append("❌ Failed to add processed article")
+            _emit(out)
+            return False
+
+        # Update last checked
+        success = storage.update_last_checked_article(
+            latest_article['url'],
+            latest_article['title'],
+            latest_article['date']
+        )
+
+        if not success:
+            out.append("❌ Failed to update last checked")
+            _emit(out)
+            return False
+
+    out.append("✅ Data saved successfully")
+
+    # Persist fresh validators only now that the article is fully
+    # processed - the same invariant the real monitor holds, so a failed
+    # run can't leave validators that make the next one 304-skip the
+    # still-unprocessed article
+    if scraper.index_validators:
+        storage.set_index_validators(scraper.index_validators)
+    _emit(out)
+
     # Step 5: Test Discord notification (without sending)
-    print("\n📢 Step 5: Testing Discord notification...")
-    
-    if discord_bot.is_configured():
-        print("✅ Discord webhook is configured")
-        
-        # Ask user if they want to send a test notification
-        response = input("   Send test Discord notification? (y/n): ").lower().strip()
-        
-        if response == 'y':
+    out.append("\n📢 Step 5: Testing Discord notification...")
+
+    if discord_configured:
+        out.append("✅ Discord webhook is configured")
+
+        # Sending is opted into via --send-discord rather than an
+        # interactive prompt, so the test runs unattended from cron/CI
+        if send_discord:
             success = discord_bot.send_new_shows_alert(
                 latest_article['title'],
                 latest_article['date'],
                 latest_article['url'],
                 shows
             )
-            
+
             if success:
-                print("✅ Discord notification sent successfully!")
+                out.append("✅ Discord notification sent successfully!")
             else:
-                print("❌ Failed to send Discord notification")
+                out.append("❌ Failed to send Discord notification")
         else:
-            print("ℹ️  Skipped Discord notification")
+            out.append("ℹ️  Skipped Discord notification")
     else:
-        print("ℹ️  Discord webhook not configured - would skip notification")
-    
-    print("\n🎉 Integration test completed successfully!")
+        out.append("ℹ️  Discord webhook not configured - would skip notification")
+
+    out.append("\n🎉 Integration test completed successfully!")
+    _emit(out)
     return True
 
 def test_storage_search():
     """Test storage search and filtering functionality."""
-    print("\n🔍 Testing Storage Search & Filtering")
-    print("=" * 40)
-    
+    out = []
+    out.append("\n🔍 Testing Storage Search & Filtering")
+    out.append("=" * 40)
+
     storage = ShowDataStorage()
-    
-    # Test platform filtering
-    netflix_shows = storage.get_shows_by_platform('Netflix', limit=5)
-    print(f"Netflix shows: {len(netflix_shows)}")
-    for show in netflix_shows[:2]:
-        print(f"  - {show['title']} (from {show['article_date']})")
-    
+
+    # Test platform filtering - only two entries are printed, so pull
+    # them lazily and stop the history scan there
+    netflix_shows = list(islice(storage.iter_shows_by_platform('Netflix'), 2))
+    out.append(f"Netflix shows (first {len(netflix_shows)}):")
+    out.extend(
+        f"  - {show['title']} (from {show['article_date']})"
+        for show in netflix_shows
+    )
+
     # Test search
     search_results = storage.search_shows('show', limit=3)
-    print(f"Search results for 'show': {len(search_results)}")
-    for show in search_results:
-        print(f"  - {show['title']} ({show['platform']})")
-    
+    out.append(f"Search results for 'show': {len(search_results)}")
+    out.extend(
+        f"  - {show['title']} ({show['platform']})"
+        for show in search_results
+    )
+
     # Show recent history
     history = storage.get_shows_history(limit=2)
-    print(f"Recent history entries: {len(history)}")
-    for entry in history:
-        print(f"  - {entry['article_title']} ({entry['article_date']}) - {entry['shows_count']} shows")
+    out.append(f"Recent history entries: {len(history)}")
+    out.extend(
+        f"  - {entry['article_title']} ({entry['article_date']}) - {entry['shows_count']} shows"
+        for entry in history
+    )
+    _emit(out)
 
 def main():
     """Run integration tests."""
-    print("🚀 Guardian Seven Best Shows Monitor - Integration Test")
-    print("=" * 60)
-    
+    parser = argparse.ArgumentParser(description="Guardian monitor integration test")
+    parser.add_argument('--send-discord', action='store_true',
+                        help='Send a real Discord notification if configured')
+    args = parser.parse_args()
+
+    _emit([
+        "🚀 Guardian Seven Best Shows Monitor - Integration Test",
+        "=" * 60,
+    ])
+
     # Test complete workflow
-    success = test_complete_workflow()
-    
+    success = test_complete_workflow(send_discord=args.send_discord)
+
     if success:
         # Test storage functionality
         test_storage_search()
-        
-        print("\n" + "=" * 60)
-        print("✅ All integration tests passed!")
-        print("\nNext steps:")
-        print("1. Set up Discord webhook URL in .env file")
-        print("2. Run the main application")
-        print("3. Set up scheduling (cron job) for regular checks")
+
+        _emit([
+            "\n" + "=" * 60,
+            "✅ All integration tests passed!",
+            "\nNext steps:",
+            "1. Set up Discord webhook URL in .env file",
+            "2. Run the main application",
+            "3. Set up scheduling (cron job) for regular checks",
+        ])
     else:
-        print("\n❌ Integration test failed")
+        _emit(["\n❌ Integration test failed"])
         sys.exit(1)
 
 if __name__ == "__main__":
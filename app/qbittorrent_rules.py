@@ -8,11 +8,12 @@ discovered by the Guardian Seven Best Shows Monitor.
 
 import json
 import os
-import shutil
+import re
 import subprocess
 import time
 import gzip
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Set
 import logging
@@ -21,6 +22,61 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Process names to match, mirroring the old `pgrep -x` checks
+_QBT_PROCESS_NAMES = ('qbittorrent', 'qbittorrent-nox')
+
+# Sidecar cache of the last known qBittorrent PID, so repeated liveness
+# checks across runs cost one syscall instead of a full /proc walk
+_QBT_PID_CACHE = Path.home() / '.cache' / 'guardian-qbt' / 'qbt.pid'
+
+# Title-cleaning patterns compiled once, not per clean_title_for_search call
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=1024)
+def _clean_title(title: str) -> str:
+    """Strip punctuation and collapse whitespace, memoized since titles
+    recur across rule creation and the create_missing_rules print block."""
+    return _WHITESPACE_RE.sub(' ', _NON_WORD_RE.sub('', title)).strip()
+
+# Invariant parts of a download rule, built once; create_rule_template
+# merges in only the per-show fields
+_AFFECTED_FEEDS = (
+    "https://eztv.re/ezrss.xml",
+    "https://www.torrentfunk.com/television/rss.xml"
+)
+
+_TORRENT_PARAMS_SKELETON = {
+    "category": "AlexTV",
+    "download_limit": -1,
+    "download_path": "",
+    "inactive_seeding_time_limit": 0,  # Don't seed
+    "operating_mode": "AutoManaged",
+    "ratio_limit": 0,  # Don't seed
+    "save_path": "",
+    "seeding_time_limit": 0,  # Don't seed
+    "skip_checking": False,
+    "upload_limit": -1,
+    "use_auto_tmm": True
+}
+
+_RULE_SKELETON = {
+    "addPaused": None,
+    "affectedFeeds": _AFFECTED_FEEDS,
+    "assignedCategory": "AlexTV",
+    "enabled": True,  # Enable rules automatically
+    "episodeFilter": "1x1-;",
+    "ignoreDays": 0,
+    "lastMatch": "",
+    "mustNotContain": "4K|2160|8K",
+    "priority": 0,
+    "savePath": "",
+    "smartFilter": False,
+    "torrentContentLayout": None,
+    "useRegex": False
+}
+
 class QBittorrentRulesManager:
     def __init__(self, rules_file_path: Optional[str] = None):
         """Initialize the rules manager."""
@@ -34,80 +90,206 @@ class QBittorrentRulesManager:
         self.backup_dir = Path.home() / ".config" / "qBittorrent" / "rss" / "backups"
         self.backup_dir.mkdir(exist_ok=True)
     
+    def _qbittorrent_pids(self) -> List[int]:
+        """
+        Enumerate qBittorrent PIDs with one in-process /proc scan instead
+        of forking a pgrep per process name.
+        """
+        if not os.path.isdir('/proc'):
+            return self._qbittorrent_pids_pgrep()
+
+        pids = []
+        with os.scandir('/proc') as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f'/proc/{entry.name}/comm', 'rb') as f:
+                        name = f.read().rstrip().decode()
+                except OSError:
+                    continue  # Process exited while scanning
+                if name in _QBT_PROCESS_NAMES:
+                    pids.append(int(entry.name))
+        return pids
+
+    def _qbittorrent_pids_pgrep(self) -> List[int]:
+        """Fallback PID enumeration via pgrep for systems without /proc."""
+        pids: List[int] = []
+        for name in _QBT_PROCESS_NAMES:
+            result = subprocess.run(['pgrep', '-x', name],
+                                    capture_output=True, text=True)
+            if result.returncode == 0:
+                pids.extend(int(pid) for pid in result.stdout.split())
+        return pids
+
+    def _pid_is_qbittorrent(self, pid: int) -> bool:
+        """Confirm a cached PID is alive and still names qBittorrent (the
+        comm check guards against PID reuse by an unrelated process)."""
+        try:
+            with open(f'/proc/{pid}/comm', 'rb') as f:
+                return f.read().rstrip().decode() in _QBT_PROCESS_NAMES
+        except OSError:
+            return False
+
+    def _read_pid_cache(self) -> Optional[int]:
+        """Read the last known qBittorrent PID from the sidecar cache."""
+        try:
+            return int(_QBT_PID_CACHE.read_text())
+        except (OSError, ValueError):
+            return None
+
+    def _write_pid_cache(self, pid: int) -> None:
+        """Record a confirmed qBittorrent PID for later constant-time checks."""
+        try:
+            _QBT_PID_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            _QBT_PID_CACHE.write_text(str(pid))
+        except OSError:
+            pass  # Cache is best-effort; the full scan still works without it
+
     def is_qbittorrent_running(self) -> bool:
         """Check if qBittorrent is currently running."""
         try:
-            result = subprocess.run(['pgrep', '-x', 'qbittorrent'], 
-                                  capture_output=True, text=True)
-            if result.returncode == 0:
+            # Fast path: the cached PID from a previous run costs one
+            # /proc/<pid>/comm read instead of enumerating every process
+            cached = self._read_pid_cache()
+            if cached is not None and self._pid_is_qbittorrent(cached):
                 return True
-            # Also check for qbittorrent-nox (headless variant)
-            result = subprocess.run(['pgrep', '-x', 'qbittorrent-nox'], 
-                                  capture_output=True, text=True)
-            return result.returncode == 0
+
+            pids = self._qbittorrent_pids()
+            if pids:
+                self._write_pid_cache(pids[0])
+            return bool(pids)
         except Exception as e:
             logger.warning(f"Could not check qBittorrent status: {e}")
             return False
     
+    def _wait_for_exit(self, pids: List[int], timeout: float) -> bool:
+        """
+        Wait for the given PIDs to exit. On Linux this blocks on pidfds, so
+        the kernel wakes us the instant the last process exits; elsewhere
+        (or on kernels without pidfd) it falls back to probing liveness with
+        os.kill(pid, 0) at 100 ms granularity.
+
+        Returns:
+            True if every PID exited within the timeout
+        """
+        deadline = time.monotonic() + timeout
+        alive = set(pids)
+
+        if hasattr(os, 'pidfd_open'):
+            try:
+                return self._wait_for_exit_pidfd(alive, deadline)
+            except OSError:
+                pass  # pidfd unsupported on this kernel - fall back to probing
+
+        while alive:
+            for pid in list(alive):
+                try:
+                    os.kill(pid, 0)
+                except ProcessLookupError:
+                    alive.discard(pid)
+                except PermissionError:
+                    pass  # Still alive, owned by another user
+            if not alive or time.monotonic() >= deadline:
+                break
+            time.sleep(0.1)
+        return not alive
+
+    def _wait_for_exit_pidfd(self, pids: Set[int], deadline: float) -> bool:
+        """
+        Event-driven exit wait: a pidfd becomes readable exactly when its
+        process exits, so poll() sleeps until notified instead of sampling.
+        """
+        import select
+
+        fds = {}
+        try:
+            for pid in pids:
+                try:
+                    fds[os.pidfd_open(pid)] = pid
+                except ProcessLookupError:
+                    continue  # Already exited
+
+            poller = select.poll()
+            for fd in fds:
+                poller.register(fd, select.POLLIN)
+
+            remaining = set(fds)
+            while remaining:
+                timeout_ms = max(0, int((deadline - time.monotonic()) * 1000))
+                events = poller.poll(timeout_ms)
+                if not events:
+                    return False  # Timed out with processes still alive
+                for fd, _ in events:
+                    poller.unregister(fd)
+                    remaining.discard(fd)
+            return True
+        finally:
+            for fd in fds:
+                os.close(fd)
+
     def close_qbittorrent(self) -> bool:
         """Close qBittorrent gracefully."""
-        if not self.is_qbittorrent_running():
+        pids = self._qbittorrent_pids()
+        if not pids:
             logger.info("qBittorrent is not running")
             return True
-        
+
         try:
             logger.info("Closing qBittorrent...")
             # Try graceful shutdown first
             subprocess.run(['pkill', '-TERM', 'qbittorrent'], check=False)
-            
+
             # Wait up to 10 seconds for graceful shutdown
-            for i in range(10):
-                time.sleep(1)
-                if not self.is_qbittorrent_running():
-                    logger.info("qBittorrent closed gracefully")
-                    return True
-                logger.info(f"Waiting for qBittorrent to close... ({i+1}/10)")
-            
+            if self._wait_for_exit(pids, timeout=10):
+                logger.info("qBittorrent closed gracefully")
+                return True
+
             # Force kill if still running
             logger.warning("Force closing qBittorrent...")
             subprocess.run(['pkill', '-KILL', 'qbittorrent'], check=False)
-            time.sleep(2)
-            
-            if not self.is_qbittorrent_running():
+
+            if self._wait_for_exit(self._qbittorrent_pids(), timeout=2):
                 logger.info("qBittorrent force closed")
                 return True
             else:
                 logger.error("Failed to close qBittorrent")
                 return False
-                
+
         except Exception as e:
             logger.error(f"Error closing qBittorrent: {e}")
             return False
-    
+
     def start_qbittorrent(self) -> bool:
         """Start qBittorrent."""
         if self.is_qbittorrent_running():
             logger.info("qBittorrent is already running")
             return True
-        
+
         try:
             logger.info("Starting qBittorrent...")
-            # Start qBittorrent in background
-            subprocess.Popen(['qbittorrent'], 
-                           stdout=subprocess.DEVNULL, 
-                           stderr=subprocess.DEVNULL)
-            
-            # Wait up to 15 seconds for startup
-            for i in range(15):
-                time.sleep(1)
+            # Start qBittorrent in background, keeping the handle so an
+            # immediate launch failure is detected without waiting out the
+            # full timeout
+            process = subprocess.Popen(['qbittorrent'],
+                                       stdout=subprocess.DEVNULL,
+                                       stderr=subprocess.DEVNULL)
+
+            # Wait up to 15 seconds for startup, probing at 100 ms
+            deadline = time.monotonic() + 15
+            while time.monotonic() < deadline:
+                returncode = process.poll()
+                if returncode is not None and returncode != 0:
+                    logger.error(f"qBittorrent exited immediately with code {returncode}")
+                    return False
                 if self.is_qbittorrent_running():
                     logger.info("qBittorrent started successfully")
                     return True
-                logger.info(f"Waiting for qBittorrent to start... ({i+1}/15)")
-            
+                time.sleep(0.1)
+
             logger.error("qBittorrent failed to start within 15 seconds")
             return False
-            
+
         except Exception as e:
             logger.error(f"Error starting qBittorrent: {e}")
             return False
@@ -120,10 +302,18 @@ class QBittorrentRulesManager:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_file = self.backup_dir / f"download_rules_backup_{timestamp}.json.gz"
         
-        # Create compressed backup
-        with open(self.rules_file, 'rb') as f_in:
-            with gzip.open(backup_file, 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
+        # Compress in one pass - level 1 deflate is several times faster
+        # than the default and JSON compresses well regardless
+        data = gzip.compress(self.rules_file.read_bytes(), compresslevel=1)
+
+        # Publish atomically so a crash mid-write can never leave a partial
+        # .json.gz for cleanup to trip over. On Linux, O_TMPFILE creates an
+        # anonymous file in the backup directory that only gains a name via
+        # the final link; elsewhere, write a .tmp sibling and rename it.
+        if not self._backup_via_tmpfile(data, backup_file):
+            tmp_file = backup_file.with_name(backup_file.name + '.tmp')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, backup_file)
         
         logger.info(f"Compressed backup created: {backup_file}")
         
@@ -132,30 +322,68 @@ class QBittorrentRulesManager:
         
         return backup_file
     
+    def _backup_via_tmpfile(self, data: bytes, backup_file: Path) -> bool:
+        """
+        Write a backup through an anonymous O_TMPFILE that only gains its
+        name via the final link, so no partial file is ever visible.
+
+        Returns:
+            True on success; False if the kernel or filesystem doesn't
+            support O_TMPFILE/linkat (caller falls back to tmp + rename)
+        """
+        if not hasattr(os, 'O_TMPFILE'):
+            return False
+        try:
+            fd = os.open(self.backup_dir, os.O_TMPFILE | os.O_WRONLY, 0o644)
+        except OSError:
+            return False
+        try:
+            os.write(fd, data)
+            os.link(f'/proc/self/fd/{fd}', backup_file)
+            return True
+        except OSError:
+            return False  # e.g. overlayfs rejects linking via /proc
+        finally:
+            os.close(fd)
+
+    def _list_backups(self) -> List[os.DirEntry]:
+        """
+        List backup files (compressed and uncompressed) with one scandir
+        pass instead of a glob per pattern. DirEntry caches the stat result
+        for callers that sort or size the listing.
+        """
+        try:
+            with os.scandir(self.backup_dir) as entries:
+                return [
+                    e for e in entries
+                    if e.name.startswith('download_rules_backup_')
+                    and e.name.endswith(('.json', '.json.gz'))
+                ]
+        except OSError as e:
+            logger.warning(f"Could not list backup directory: {e}")
+            return []
+
     def _cleanup_old_backups(self, max_backups: int = 10) -> None:
         """Clean up old backup files, keeping only the most recent ones."""
         try:
-            # Get all backup files (both compressed and uncompressed)
-            backup_patterns = ["download_rules_backup_*.json", "download_rules_backup_*.json.gz"]
-            backup_files = []
-            for pattern in backup_patterns:
-                backup_files.extend(list(self.backup_dir.glob(pattern)))
-            
+            backup_files = self._list_backups()
+
             if len(backup_files) <= max_backups:
                 return  # No cleanup needed
-            
-            # Sort by modification time (newest first)
-            backup_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-            
+
+            # Stat once per file, then sort by modification time (newest first)
+            entries = [(f.stat().st_mtime, f) for f in backup_files]
+            entries.sort(key=lambda e: e[0], reverse=True)
+
             # Keep only the most recent max_backups files
-            files_to_keep = backup_files[:max_backups]
-            files_to_delete = backup_files[max_backups:]
-            
+            files_to_keep = [f for _, f in entries[:max_backups]]
+            files_to_delete = [f for _, f in entries[max_backups:]]
+
             # Delete old backup files
             deleted_count = 0
             for backup_file in files_to_delete:
                 try:
-                    backup_file.unlink()
+                    os.unlink(backup_file.path)
                     deleted_count += 1
                     logger.info(f"Deleted old backup: {backup_file.name}")
                 except Exception as e:
@@ -170,12 +398,8 @@ class QBittorrentRulesManager:
     def show_backup_status(self) -> None:
         """Show status of backup files."""
         try:
-            # Get all backup files (both compressed and uncompressed)
-            backup_patterns = ["download_rules_backup_*.json", "download_rules_backup_*.json.gz"]
-            backup_files = []
-            for pattern in backup_patterns:
-                backup_files.extend(list(self.backup_dir.glob(pattern)))
-            
+            backup_files = self._list_backups()
+
             print("=== qBittorrent Rules Backup Status ===")
             print(f"Backup directory: {self.backup_dir}")
             print(f"Total backup files: {len(backup_files)}")
@@ -184,15 +408,16 @@ class QBittorrentRulesManager:
                 print("No backup files found")
                 return
             
-            # Sort by modification time (newest first)
-            backup_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-            
-            # Calculate total size and compression stats
-            total_size = sum(f.stat().st_size for f in backup_files)
+            # Stat once per file, then sort by modification time (newest first)
+            entries = [(f.stat(), f) for f in backup_files]
+            entries.sort(key=lambda e: e[0].st_mtime, reverse=True)
+
+            # Calculate total size and compression stats from cached stats
+            total_size = sum(st.st_size for st, _ in entries)
             total_size_mb = total_size / (1024 * 1024)
-            
-            compressed_files = [f for f in backup_files if f.name.endswith('.gz')]
-            uncompressed_files = [f for f in backup_files if not f.name.endswith('.gz')]
+
+            compressed_files = [f for _, f in entries if f.name.endswith('.gz')]
+            uncompressed_files = [f for _, f in entries if not f.name.endswith('.gz')]
             
             print(f"Total size: {total_size_mb:.2f} MB")
             print(f"Compressed files: {len(compressed_files)}")
@@ -205,11 +430,13 @@ class QBittorrentRulesManager:
                 print("✅ Backup count within limit")
             
             print("\nRecent backup files:")
-            for i, backup_file in enumerate(backup_files[:5]):  # Show 5 most recent
-                size_kb = backup_file.stat().st_size / 1024
-                mtime = datetime.fromtimestamp(backup_file.stat().st_mtime)
+            for i, (stat, backup_file) in enumerate(entries[:5]):  # Show 5 most recent
+                size_kb = stat.st_size / 1024
+                # time.strftime formats the cached mtime without building a
+                # datetime object per entry
+                mtime = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(stat.st_mtime))
                 compression_info = " (compressed)" if backup_file.name.endswith('.gz') else " (uncompressed)"
-                print(f"  {i+1}. {backup_file.name} ({size_kb:.1f} KB{compression_info}, {mtime.strftime('%Y-%m-%d %H:%M:%S')})")
+                print(f"  {i+1}. {backup_file.name} ({size_kb:.1f} KB{compression_info}, {mtime})")
             
             if len(backup_files) > 5:
                 print(f"  ... and {len(backup_files) - 5} more")
@@ -220,12 +447,8 @@ class QBittorrentRulesManager:
     def cleanup_backups(self, max_backups: int = 10) -> None:
         """Manually clean up old backup files."""
         try:
-            # Get all backup files (both compressed and uncompressed)
-            backup_patterns = ["download_rules_backup_*.json", "download_rules_backup_*.json.gz"]
-            backup_files = []
-            for pattern in backup_patterns:
-                backup_files.extend(list(self.backup_dir.glob(pattern)))
-            
+            backup_files = self._list_backups()
+
             print("=== Cleaning Up Old Backup Files ===")
             print(f"Found {len(backup_files)} backup files")
             
@@ -233,23 +456,24 @@ class QBittorrentRulesManager:
                 print(f"✅ Only {len(backup_files)} files found, no cleanup needed (max: {max_backups})")
                 return
             
-            # Sort by modification time (newest first)
-            backup_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-            
-            files_to_keep = backup_files[:max_backups]
-            files_to_delete = backup_files[max_backups:]
-            
+            # Stat once per file, then sort by modification time (newest first)
+            entries = [(f.stat(), f) for f in backup_files]
+            entries.sort(key=lambda e: e[0].st_mtime, reverse=True)
+
+            files_to_keep = [f for _, f in entries[:max_backups]]
+            files_to_delete = entries[max_backups:]
+
             print(f"Keeping {len(files_to_keep)} most recent files")
             print(f"Deleting {len(files_to_delete)} old files:")
-            
+
             deleted_count = 0
             freed_space = 0
-            
-            for backup_file in files_to_delete:
+
+            for stat, backup_file in files_to_delete:
                 try:
-                    file_size = backup_file.stat().st_size
+                    file_size = stat.st_size
                     compression_info = " (compressed)" if backup_file.name.endswith('.gz') else " (uncompressed)"
-                    backup_file.unlink()
+                    os.unlink(backup_file.path)
                     deleted_count += 1
                     freed_space += file_size
                     print(f"  ✅ Deleted: {backup_file.name}{compression_info}")
@@ -268,17 +492,20 @@ class QBittorrentRulesManager:
     def load_rules(self) -> Dict:
         """Load existing qBittorrent rules."""
         try:
-            with open(self.rules_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # One read + one parse instead of json.load pulling from a
+            # buffered text stream
+            return json.loads(self.rules_file.read_bytes())
         except Exception as e:
             logger.error(f"Error loading rules: {e}")
             raise
-    
+
     def save_rules(self, rules: Dict) -> None:
         """Save rules back to qBittorrent config."""
         try:
-            with open(self.rules_file, 'w', encoding='utf-8') as f:
-                json.dump(rules, f, indent=4, ensure_ascii=False)
+            # Serialize in one pass and write in one call - json.dump would
+            # issue a small write per token
+            self.rules_file.write_text(json.dumps(rules, indent=4, ensure_ascii=False),
+                                       encoding='utf-8')
             logger.info(f"Rules saved to: {self.rules_file}")
         except Exception as e:
             logger.error(f"Error saving rules: {e}")
@@ -293,22 +520,24 @@ class QBittorrentRulesManager:
                 logger.warning("No Guardian data found")
                 return []
             
-            with open(guardian_data_file, 'r') as f:
-                history = json.load(f)
-            
-            # Extract unique shows
+            history = json.loads(guardian_data_file.read_bytes())
+
+            # Extract unique shows in one pass, skipping all work for
+            # titles already seen
             shows = {}
             for entry in history:
                 for show in entry['shows']:
                     title = show['title']
-                    if title not in shows:
-                        shows[title] = {
-                            'title': title,
-                            'platform': show.get('platform', 'Unknown'),
-                            'pick_of_the_week': show.get('pick_of_the_week', False),
-                            'description': show.get('description', '')[:100] + '...' if show.get('description') else ''
-                        }
-            
+                    if title in shows:
+                        continue
+                    description = show.get('description') or ''
+                    shows[title] = {
+                        'title': title,
+                        'platform': show.get('platform', 'Unknown'),
+                        'pick_of_the_week': show.get('pick_of_the_week', False),
+                        'description': description[:100] + '...' if description else ''
+                    }
+
             return list(shows.values())
             
         except Exception as e:
@@ -327,56 +556,23 @@ class QBittorrentRulesManager:
     
     def clean_title_for_search(self, title: str) -> str:
         """Clean show title for search - remove punctuation and special characters."""
-        import re
-        # Remove all punctuation and special characters, keep only alphanumeric and spaces
-        cleaned = re.sub(r'[^\w\s]', '', title)
-        # Replace multiple spaces with single space and strip
-        cleaned = re.sub(r'\s+', ' ', cleaned).strip()
-        return cleaned
+        return _clean_title(title)
     
     def create_rule_template(self, show_title: str, platform: str = "Unknown") -> Dict:
         """Create a new download rule template for a show."""
         # Clean title for mustContain (no punctuation + 1080)
         clean_title = self.clean_title_for_search(show_title)
-        must_contain = f"{clean_title} 1080"
-        must_not_contain = "4K|2160|8K"
-        
+
         # Always put show title first in tags, followed by "Guardian Best Shows"
-        tags = [show_title, "Guardian Best Shows"]
-        
+        # (mutable fields get fresh objects so rules never share state)
         return {
-            "addPaused": None,
-            "affectedFeeds": [
-                "https://eztv.re/ezrss.xml",
-                "https://www.torrentfunk.com/television/rss.xml"
-            ],
-            "assignedCategory": "AlexTV",
-            "enabled": True,  # Enable rules automatically
-            "episodeFilter": "1x1-;",
-            "ignoreDays": 0,
-            "lastMatch": "",
-            "mustContain": must_contain,
-            "mustNotContain": must_not_contain,
+            **_RULE_SKELETON,
+            "mustContain": f"{clean_title} 1080",
             "previouslyMatchedEpisodes": [],
-            "priority": 0,
-            "savePath": "",
-            "smartFilter": False,
-            "torrentContentLayout": None,
             "torrentParams": {
-                "category": "AlexTV",
-                "download_limit": -1,
-                "download_path": "",
-                "inactive_seeding_time_limit": 0,  # Don't seed
-                "operating_mode": "AutoManaged",
-                "ratio_limit": 0,  # Don't seed
-                "save_path": "",
-                "seeding_time_limit": 0,  # Don't seed
-                "skip_checking": False,
-                "tags": tags,
-                "upload_limit": -1,
-                "use_auto_tmm": True
-            },
-            "useRegex": False
+                **_TORRENT_PARAMS_SKELETON,
+                "tags": [show_title, "Guardian Best Shows"]
+            }
         }
     
     def analyze_shows(self) -> None:
@@ -398,13 +594,14 @@ class QBittorrentRulesManager:
             
             shows_with_rules = []
             shows_needing_rules = []
-            
+
+            # One membership set and an inline test instead of a method
+            # call + list allocation per show
+            existing = set(rules)
             for show in guardian_shows:
                 title = show['title']
-                matches = self.check_existing_rules(title, rules)
-                
-                if matches:
-                    shows_with_rules.append((show, matches))
+                if title in existing:
+                    shows_with_rules.append((show, [f"Exact: {title}"]))
                 else:
                     shows_needing_rules.append(show)
             
@@ -447,11 +644,10 @@ class QBittorrentRulesManager:
             rules = self.load_rules()
             guardian_shows = self.get_guardian_shows()
             
-            shows_needing_rules = []
-            for show in guardian_shows:
-                matches = self.check_existing_rules(show['title'], rules)
-                if not matches:
-                    shows_needing_rules.append(show)
+            existing = set(rules)
+            shows_needing_rules = [
+                show for show in guardian_shows if show['title'] not in existing
+            ]
             
             if not shows_needing_rules:
                 print("✅ All Guardian shows already have rules!")
@@ -465,7 +661,10 @@ class QBittorrentRulesManager:
                 if auto_manage_qbt:
                     print("\n🔧 Managing qBittorrent process...")
                     
-                    # Check if qBittorrent is running
+                    # Check if qBittorrent is running. close_qbittorrent
+                    # waits for the PIDs to actually exit before returning
+                    # True, so its result is definitive - no need to rescan
+                    # the process table afterwards.
                     was_running = self.is_qbittorrent_running()
                     if was_running:
                         print("📴 qBittorrent is running - closing it...")
@@ -474,11 +673,6 @@ class QBittorrentRulesManager:
                             return
                     else:
                         print("✅ qBittorrent is not running")
-                    
-                    # Double-check it's closed
-                    if self.is_qbittorrent_running():
-                        print("❌ qBittorrent is still running. Please close it manually and try again.")
-                        return
                 else:
                     # Manual mode - just warn user
                     if self.is_qbittorrent_running():
@@ -494,9 +688,9 @@ class QBittorrentRulesManager:
                 print(f"📁 Backup created: {backup_file}")
             
             print(f"\n🔧 {'Would create' if dry_run else 'Creating'} rules for {len(shows_needing_rules)} shows:")
-            
-            new_rules = rules.copy()
-            
+
+            # The backup above preserves the original state, so mutate the
+            # loaded dict in place rather than duplicating the whole rule set
             for show in shows_needing_rules:
                 title = show['title']
                 rule = self.create_rule_template(title, show['platform'])
@@ -516,11 +710,11 @@ class QBittorrentRulesManager:
                 print(f"     Status: {'Would create' if dry_run else 'Created'} (enabled)")
                 
                 if not dry_run:
-                    new_rules[title] = rule
+                    rules[title] = rule
             
             if not dry_run:
                 # Save the rules
-                self.save_rules(new_rules)
+                self.save_rules(rules)
                 print(f"\n✅ Successfully added {len(shows_needing_rules)} new rules!")
                 print("⚠️  Rules are created ENABLED - they will start downloading automatically")
                 
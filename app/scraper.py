@@ -4,20 +4,125 @@ Handles fetching series index, finding latest articles, and parsing show recomme
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
 import re
+import time
 import logging
 from typing import List, Dict, Optional, Any, Tuple
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Sentinel returned for index pages that report 304 Not Modified
+NOT_MODIFIED = object()
+
+# How long parsed article results stay valid - published articles don't
+# change, so an hour comfortably covers re-polls within one process
+_PARSE_CACHE_TTL = 3600.0
+
+# Prefer the C-based lxml parser when installed; html.parser is the
+# pure-Python fallback so lxml stays an optional speedup, not a hard dep
+try:
+    import lxml  # noqa: F401
+    _PARSER = 'lxml'
+except ImportError:
+    _PARSER = 'html.parser'
+
+# Index pages are only mined for links, so skip building everything else
+_INDEX_LINK_STRAINER = SoupStrainer('a', href=True)
+
+# Advertise Brotli only when a decoder is importable - requests decodes
+# transparently via urllib3, but advertising an encoding we can't decode
+# would hand back compressed bytes. Brotli HTML runs ~15-20% smaller
+# than gzip, which matters on the multi-hundred-KB series page.
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = 'br, gzip, deflate'
+    except ImportError:
+        _ACCEPT_ENCODING = 'gzip, deflate'
+
+# Restricts article parsing to the Guardian body div, skipping tree
+# construction for the header/footer/ad markup that dominates the page
+_ARTICLE_BODY_STRAINER = SoupStrainer('div', attrs={'data-gu-name': 'body'})
+
+# Patterns compiled once at import so repeated scans reuse the compiled
+# program instead of re-deriving it per call
+_ARTICLE_URL_RE = re.compile(
+    r'/tv-and-radio/\d{4}/\w{3}/\d{2}/.+(?:seven-best-shows|best-shows-to-stream)'
+)
+_YEAR_SEGMENT_RE = re.compile(r'/\d{4}/')
+_URL_DATE_RE = re.compile(r'/(\d{4})/([A-Za-z]{3})/(\d{2})/')
+_NUMBERED_HEADING_RE = re.compile(r'^h[23]$')
+_BOLD_TAG_RE = re.compile(r'^(strong|b)$')
+_NUMBERED_PREFIX_RE = re.compile(r'^\d+\.')
+_NUMBERED_TITLE_RE = re.compile(r'^\d+\.\s*(.+)')
+_NUMBERED_LINE_RE = re.compile(r'^\s*\d+\.\s*(.+)$', re.MULTILINE)
+_PICK_PREFIX_RE = re.compile(r'^pick of the week\s*', re.IGNORECASE)
+_SKIP_HEADING_RE = re.compile(
+    r'^(?:pick of the week$|privacy notice|related:|more on this story|advertisement)',
+    re.IGNORECASE,
+)
+_ARTICLE_BODY_CLASS_RE = re.compile(r'article|content|body')
+
+# Streaming platform keywords -> canonical display names. The combined
+# alternation regex finds the first mention in one linear pass instead of
+# probing the text once per platform; longer keys sort first so e.g.
+# "hbo max" wins over "hbo" at the same position.
+_PLATFORMS = {
+    'netflix': 'Netflix',
+    'amazon prime': 'Amazon Prime Video',
+    'prime video': 'Amazon Prime Video',
+    'disney+': 'Disney+',
+    'disney plus': 'Disney+',
+    'hbo max': 'HBO Max',
+    'hbo': 'HBO',
+    'hulu': 'Hulu',
+    'apple tv': 'Apple TV+',
+    'paramount+': 'Paramount+',
+    'peacock': 'Peacock',
+    'bbc iplayer': 'BBC iPlayer',
+    'itv hub': 'ITV Hub',
+    'all 4': 'All 4',
+    'channel 4': 'All 4',
+    'sky': 'Sky',
+    'now tv': 'NOW TV',
+    'britbox': 'BritBox',
+    'youtube': 'YouTube',
+    'crunchyroll': 'Crunchyroll'
+}
+_PLATFORM_RE = re.compile('|'.join(
+    re.escape(key) for key in sorted(_PLATFORMS, key=len, reverse=True)
+))
+
+def _fast_text(node) -> str:
+    """
+    Join a node's descendant strings in one pass and strip once at the
+    end. get_text(strip=True) strips every fragment individually and
+    glues them with no separator, which both costs more and welds words
+    together across inline tags; this keeps the visible whitespace.
+    """
+    return ''.join(node.strings).strip()
+
+
+# Month abbreviation -> zero-padded number for Guardian URL dates
+_MONTH_MAP = {
+    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
+    'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
+    'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
+}
+
 class GuardianScraper:
     """Scraper for The Guardian's Seven Best Shows series."""
     
-    def __init__(self, series_urls: Optional[List[str]] = None, timeout: int = 10, user_agent: Optional[str] = None, retry_attempts: int = 3, retry_delay: int = 5):
+    def __init__(self, series_urls: Optional[List[str]] = None, timeout: int = 10, user_agent: Optional[str] = None, retry_attempts: int = 3, retry_delay: int = 5, session: Optional[requests.Session] = None):
         self.base_url = "https://www.theguardian.com"
         self.series_urls = series_urls or [
             "https://www.theguardian.com/tv-and-radio/series/the-seven-best-shows-to-stream-this-week"
@@ -29,87 +134,194 @@ class GuardianScraper:
             'User-Agent': user_agent or 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': _ACCEPT_ENCODING,
             'Connection': 'keep-alive',
         }
-        self.session = requests.Session()
+        # Accept an injected session so callers can share one connection
+        # pool across components; otherwise own a private one sized for
+        # concurrent article fetches (parse_many runs up to 8 workers)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        self.session = session
         self.session.headers.update(self.headers)
+        # Fresh ETag/Last-Modified validators collected by the last index scan
+        self.index_validators: Dict[str, Dict[str, str]] = {}
+        # True when every index page reported 304 on the last scan
+        self.index_unchanged = False
+        # Parsed article lists per series URL, served on 304 so a repeat
+        # scan in the same process costs zero parse CPU for unchanged pages
+        self._series_articles_cache: Dict[str, List[Dict[str, str]]] = {}
+        # Parsed shows per article URL with an expiry time, so re-polls and
+        # duplicate-detection passes skip the fetch + parse entirely
+        self._parse_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
     
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+    def _fetch_response(self, url: str, extra_headers: Optional[Dict[str, str]] = None) -> Optional[requests.Response]:
         """
-        Fetch a web page and return BeautifulSoup object.
-        
+        Fetch a URL with retries and return the raw response.
+
         Args:
             url: URL to fetch
-            
+            extra_headers: Additional headers for this request (e.g.
+                If-None-Match for conditional GETs)
+
         Returns:
-            BeautifulSoup object or None if failed
+            Response object (possibly a 304) or None if all attempts failed
         """
-        import time
-        
         for attempt in range(1, self.retry_attempts + 1):
             try:
                 logger.info(f"Fetching: {url} (attempt {attempt}/{self.retry_attempts})")
-                response = self.session.get(url, timeout=self.timeout)
+                response = self.session.get(url, timeout=self.timeout, headers=extra_headers)
+                if response.status_code == 304:
+                    return response
                 response.raise_for_status()
-                return BeautifulSoup(response.content, 'html.parser')
-                
+                return response
+
             except requests.RequestException as e:
                 logger.warning(f"Attempt {attempt} failed for {url}: {e}")
                 if attempt < self.retry_attempts:
                     time.sleep(self.retry_delay)
                 else:
                     logger.error(f"All {self.retry_attempts} attempts failed for {url}")
-            except Exception as e:
-                logger.error(f"Unexpected error parsing {url}: {e}")
-                return None
-        
+
         return None
+
+    def fetch_page(self, url: str, parse_only: Optional[SoupStrainer] = None) -> Optional[BeautifulSoup]:
+        """
+        Fetch a web page and return BeautifulSoup object.
+
+        Args:
+            url: URL to fetch
+            parse_only: Optional SoupStrainer limiting which elements get
+                built into the tree
+
+        Returns:
+            BeautifulSoup object or None if failed
+        """
+        response = self._fetch_response(url)
+        if response is None:
+            return None
+        try:
+            return BeautifulSoup(response.content, _PARSER, parse_only=parse_only)
+        except Exception as e:
+            logger.error(f"Unexpected error parsing {url}: {e}")
+            return None
+
+    def _fetch_index_page(self, url: str, validator: Optional[Dict[str, str]] = None):
+        """
+        Fetch a series index page with a conditional GET.
+
+        Args:
+            url: Series index URL
+            validator: Cached ETag/Last-Modified headers from a previous fetch
+
+        Returns:
+            BeautifulSoup object, the NOT_MODIFIED sentinel when the page
+            reports 304, or None if the fetch failed. Fresh validators are
+            recorded in self.index_validators.
+        """
+        conditional_headers = {}
+        if validator:
+            if validator.get('etag'):
+                conditional_headers['If-None-Match'] = validator['etag']
+            if validator.get('last_modified'):
+                conditional_headers['If-Modified-Since'] = validator['last_modified']
+
+        response = self._fetch_response(url, conditional_headers or None)
+        if response is None:
+            return None
+
+        if response.status_code == 304:
+            logger.info(f"Series index unchanged (304): {url}")
+            if validator:
+                self.index_validators[url] = validator
+            return NOT_MODIFIED
+
+        new_validator = {}
+        if response.headers.get('ETag'):
+            new_validator['etag'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            new_validator['last_modified'] = response.headers['Last-Modified']
+        if new_validator:
+            self.index_validators[url] = new_validator
+
+        try:
+            # Only the anchors are read downstream, so don't build the rest
+            return BeautifulSoup(response.content, _PARSER,
+                                 parse_only=_INDEX_LINK_STRAINER)
+        except Exception as e:
+            logger.error(f"Unexpected error parsing {url}: {e}")
+            return None
     
-    def get_series_articles(self) -> List[Dict[str, str]]:
+    def get_series_articles(self, validators: Optional[Dict[str, Dict[str, str]]] = None) -> List[Dict[str, str]]:
         """
         Get all articles from all configured series index pages.
-        
+
+        Args:
+            validators: Optional mapping of series URL to cached
+                ETag/Last-Modified headers. Pages that report 304 Not
+                Modified are skipped without downloading or parsing.
+
         Returns:
             List of dictionaries with article info (url, title, date)
         """
         articles = []
         seen_urls: set[str] = set()
-        
+        self.index_validators = {}
+        unmodified_count = 0
+
         for series_url in self.series_urls:
-            soup = self.fetch_page(series_url)
+            soup = self._fetch_index_page(series_url, (validators or {}).get(series_url))
+            if soup is NOT_MODIFIED:
+                unmodified_count += 1
+                # Serve the parsed list from the last fresh scan - the page
+                # hasn't changed, so neither has what we'd extract from it
+                for article in self._series_articles_cache.get(series_url, []):
+                    if article['url'] not in seen_urls:
+                        seen_urls.add(article['url'])
+                        articles.append(article)
+                continue
             if not soup:
                 continue
-            
-            article_links = soup.find_all('a', href=True)
-            
+
+            # Let find_all apply the article filter while it scans, so the
+            # Python loop below only ever sees matching links
+            article_links = soup.find_all(
+                'a',
+                href=lambda h: isinstance(h, str) and self._is_seven_best_shows_article(h)
+            )
+            page_articles = []
+
             for link in article_links:
-                href = link.get('href')
-                if not href or not isinstance(href, str):
+                href = link['href']
+                full_url = urljoin(self.base_url, href)
+                if full_url in seen_urls:
                     continue
-                    
-                if self._is_seven_best_shows_article(href):
-                    full_url = urljoin(self.base_url, href)
-                    if full_url in seen_urls:
-                        continue
-                    seen_urls.add(full_url)
-                    
-                    title = self._extract_title_from_link(link)
-                    date = self._extract_date_from_url(href)
-                    
-                    if not title and date:
-                        title = f"Seven Best Shows to Stream This Week - {date}"
-                    
-                    if date:
-                        articles.append({
-                            'url': full_url,
-                            'title': title.strip() if title else f"Seven Best Shows - {date}",
-                            'date': date,
-                            'path': href
-                        })
-        
+                seen_urls.add(full_url)
+
+                title = self._extract_title_from_link(link)
+                date = self._extract_date_from_url(href)
+
+                if not title and date:
+                    title = f"Seven Best Shows to Stream This Week - {date}"
+
+                if date:
+                    page_articles.append({
+                        'url': full_url,
+                        'title': title.strip() if title else f"Seven Best Shows - {date}",
+                        'date': date,
+                        'path': href
+                    })
+
+            self._series_articles_cache[series_url] = page_articles
+            articles.extend(page_articles)
+
+        self.index_unchanged = bool(self.series_urls) and unmodified_count == len(self.series_urls)
+
         articles.sort(key=lambda x: x['date'], reverse=True)
-        
+
         logger.info(f"Found {len(articles)} articles in series")
         return articles
     
@@ -117,60 +329,51 @@ class GuardianScraper:
         """Check if URL is a seven best shows article."""
         if not href:
             return False
-            
+
+        # Cheap substring prefilter: the vast majority of anchors on the
+        # page are navigation/footer links that never mention the section,
+        # so reject them before paying for a regex scan
+        if 'tv-and-radio' not in href and 'best-shows' not in href and 'seven-best' not in href:
+            return False
+
         # Pattern matching for Guardian seven best shows URLs
-        patterns = [
-            r'/tv-and-radio/\d{4}/\w{3}/\d{2}/.+seven-best-shows',
-            r'/tv-and-radio/\d{4}/\w{3}/\d{2}/.+best-shows-to-stream',
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, href):
-                return True
-        
+        if _ARTICLE_URL_RE.search(href):
+            return True
+
         # Also check for "seven-best" or "best-shows" in the URL
-        if 'seven-best' in href.lower() or 'best-shows-to-stream' in href.lower():
+        hlow = href.lower()
+        if 'seven-best' in hlow or 'best-shows-to-stream' in hlow:
             # Exclude film articles and series page itself
-            if 'film' in href.lower():
+            if 'film' in hlow:
                 return False
-            if '/series/' not in href and re.search(r'/\d{4}/', href):
+            if '/series/' not in href and _YEAR_SEGMENT_RE.search(href):
                 return True
-        
+
         return False
     
     def _extract_title_from_link(self, link_element) -> Optional[str]:
         """Extract article title from link element."""
         # Try different methods to get the title
-        title = link_element.get_text(strip=True)
+        title = _fast_text(link_element)
         
         if not title:
             # Look for title in nested elements
             title_elem = link_element.find(['h3', 'h2', 'span'])
             if title_elem:
-                title = title_elem.get_text(strip=True)
+                title = _fast_text(title_elem)
         
         return title if title else None
     
     def _extract_date_from_url(self, url: str) -> Optional[str]:
         """Extract date from Guardian URL pattern."""
         # Guardian URLs typically have format: /YYYY/MMM/DD/
-        date_pattern = r'/(\d{4})/(\w{3})/(\d{2})/'
-        match = re.search(date_pattern, url)
-        
+        match = _URL_DATE_RE.search(url)
+
         if match:
             year, month_abbr, day = match.groups()
-            try:
-                # Convert month abbreviation to number
-                month_map = {
-                    'jan': '01', 'feb': '02', 'mar': '03', 'apr': '04',
-                    'may': '05', 'jun': '06', 'jul': '07', 'aug': '08',
-                    'sep': '09', 'oct': '10', 'nov': '11', 'dec': '12'
-                }
-                month = month_map.get(month_abbr.lower(), '01')
-                return f"{year}-{month}-{day}"
-            except Exception:
-                pass
-        
+            month = _MONTH_MAP.get(month_abbr.lower(), '01')
+            return f"{year}-{month}-{day}"
+
         return None
     
     def get_latest_article_url(self, last_checked_url: Optional[str] = None) -> Optional[str]:
@@ -184,25 +387,20 @@ class GuardianScraper:
             URL of the latest unchecked article or None
         """
         articles = self.get_series_articles()
-        
+
         if not articles:
             logger.warning("No articles found in series")
             return None
-        
-        # If no last checked URL, return the latest article
-        if not last_checked_url:
-            return articles[0]['url']
-        
-        # Find articles newer than the last checked one
-        for article in articles:
-            if article['url'] == last_checked_url:
-                break
-            # Return the first (newest) article that's different from last checked
-            return article['url']
-        
-        # If we get here, no new articles found
-        logger.info("No new articles found since last check")
-        return None
+
+        # One max pass finds the newest article without relying on (or
+        # paying for) the list being sorted
+        latest = max(articles, key=lambda article: article['date'])
+
+        if last_checked_url and latest['url'] == last_checked_url:
+            logger.info("No new articles found since last check")
+            return None
+
+        return latest['url']
     
     def parse_show_recommendations(self, article_url: str) -> List[Dict[str, Any]]:
         """
@@ -214,15 +412,27 @@ class GuardianScraper:
         Returns:
             List of show dictionaries with title, description, platform
         """
-        soup = self.fetch_page(article_url)
+        # Serve repeat requests for the same article from the cache -
+        # published articles don't change within the TTL window
+        cached = self._parse_cache.get(article_url)
+        if cached and time.monotonic() < cached[0]:
+            logger.debug(f"Parse cache hit for {article_url}")
+            return list(cached[1])
+
+        # Parse only the article body div first - it holds every show
+        # heading and skips building the bulk of the page into a tree
+        soup = self.fetch_page(article_url, parse_only=_ARTICLE_BODY_STRAINER)
+        if soup is not None and not soup.find('div', {'data-gu-name': 'body'}):
+            # Layout changed - fall back to a full parse of the page
+            soup = self.fetch_page(article_url)
         if not soup:
             return []
-        
+
         shows = []
-        
+
         # Find the article content area
         article_content = soup.find('div', {'data-gu-name': 'body'}) or soup.find('div', class_=lambda x: x and 'article-body' in x)
-        
+
         if not article_content:
             # Fallback to searching the entire page
             article_content = soup
@@ -238,7 +448,7 @@ class GuardianScraper:
         # If no shows found with h2, try other methods
         if not shows:
             # Method 2: Look for numbered headings (h2, h3)
-            headings = article_content.find_all(re.compile(r'^h[23]$'), string=re.compile(r'^\d+\.'))  # type: ignore[call-overload]
+            headings = article_content.find_all(_NUMBERED_HEADING_RE, string=_NUMBERED_PREFIX_RE)  # type: ignore[call-overload]
             
             for heading in headings:
                 show_data = self._parse_show_from_heading(heading)
@@ -247,7 +457,7 @@ class GuardianScraper:
         
         # Method 3: Look for strong/bold text with numbers
         if not shows:
-            numbered_elements = soup.find_all(re.compile(r'^(strong|b)$'), string=re.compile(r'^\d+\.'))  # type: ignore[call-overload]
+            numbered_elements = soup.find_all(_BOLD_TAG_RE, string=_NUMBERED_PREFIX_RE)  # type: ignore[call-overload]
             for element in numbered_elements:
                 show_data = self._parse_show_from_element(element)
                 if show_data:
@@ -257,203 +467,165 @@ class GuardianScraper:
         if not shows:
             shows = self._parse_shows_from_body(soup)
         
+        # Only successful parses are cached - a failed fetch or an empty
+        # result should be retried on the next call, not remembered
+        if shows:
+            self._parse_cache[article_url] = (time.monotonic() + _PARSE_CACHE_TTL, shows)
+
         logger.info(f"Parsed {len(shows)} shows from {article_url}")
         return shows  # Return all shows found
-    
-    def _parse_show_from_guardian_heading(self, heading) -> Optional[Dict[str, Any]]:
-        """Parse show data from Guardian's h2 heading structure."""
-        title_text = heading.get_text(strip=True)
-        
-        # Skip headings that are clearly not show titles
-        skip_patterns = [
-            r'^pick of the week$',
-            r'^privacy notice',
-            r'^related:',
-            r'^more on this story',
-            r'^advertisement',
-        ]
-        
-        for pattern in skip_patterns:
-            if re.match(pattern, title_text.lower()):
-                return None
-        
-        # Check if this is the "Pick of the week" show
+
+    def parse_many(self, article_urls: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Parse show recommendations from several articles concurrently.
+
+        Args:
+            article_urls: Article URLs to fetch and parse
+
+        Returns:
+            Mapping of article URL to its list of show dictionaries
+        """
+        if not article_urls:
+            return {}
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        with ThreadPoolExecutor(max_workers=min(8, len(article_urls))) as executor:
+            futures = {
+                executor.submit(self.parse_show_recommendations, url): url
+                for url in article_urls
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return results
+
+
+    def _build_show(self, raw_title: str, description: str,
+                    default_description: str = '') -> Dict[str, Any]:
+        """
+        Assemble a show dict from a raw title and description text.
+
+        Handles the "Pick of the week" prefix, description truncation and
+        platform extraction - the tail every _parse_show_from_* method
+        used to duplicate.
+        """
         pick_of_the_week = False
-        show_title = title_text
-        
+        show_title = raw_title
+
         # Handle "Pick of the week" prefix
-        if title_text.lower().startswith('pick of the week'):
+        if raw_title.lower().startswith('pick of the week'):
             pick_of_the_week = True
             # Remove the prefix and clean up the title
-            show_title = re.sub(r'^pick of the week\s*', '', title_text, flags=re.IGNORECASE).strip()
-        
-        # Look for description in following paragraphs
+            show_title = _PICK_PREFIX_RE.sub('', raw_title).strip()
+
+        return {
+            'title': show_title,
+            'description': description[:500] if description else default_description,
+            'platform': self._extract_platform(description + " " + show_title),
+            'pick_of_the_week': pick_of_the_week
+        }
+
+    def _parse_show_from_guardian_heading(self, heading) -> Optional[Dict[str, Any]]:
+        """Parse show data from Guardian's h2 heading structure."""
+        title_text = _fast_text(heading)
+
+        # Skip headings that are clearly not show titles - one anchored
+        # alternation, with IGNORECASE replacing the per-heading .lower()
+        if _SKIP_HEADING_RE.match(title_text):
+            return None
+
+        # Look for description in the following paragraphs. Filtering the
+        # sibling walk to tags of interest skips the NavigableString nodes
+        # between elements inside BeautifulSoup instead of testing each one
         description_parts = []
-        platform = ""
-        
-        # Find next siblings for description
-        current = heading.next_sibling
-        paragraph_count = 0
-        
-        while current and paragraph_count < 3:  # Limit to avoid getting too much
-            if hasattr(current, 'name'):
-                if current.name == 'p':
-                    text = current.get_text(strip=True)
-                    if text and not text.startswith(('http', 'www', 'Related:', 'More on this story')):
-                        description_parts.append(text)
-                        paragraph_count += 1
-                elif current.name in ['h1', 'h2', 'h3'] and current != heading:
-                    break  # Stop at next heading
-            current = current.next_sibling
-        
-        description = ' '.join(description_parts)
-        
-        # Extract platform information from title and description
-        platform = self._extract_platform(description + " " + show_title)
-        
+
+        for sibling in heading.find_next_siblings(['p', 'h1', 'h2', 'h3'], limit=6):
+            if sibling.name != 'p':
+                break  # Stop at next heading
+            text = _fast_text(sibling)
+            if text and not text.startswith(('http', 'www', 'Related:', 'More on this story')):
+                description_parts.append(text)
+                if len(description_parts) == 3:  # Limit to avoid getting too much
+                    break
+
+        show = self._build_show(title_text, ' '.join(description_parts),
+                                'No description available')
+
         # Only return if we have a meaningful title
-        if len(show_title) > 2 and not show_title.lower() in ['advertisement', 'related']:
-            return {
-                'title': show_title,
-                'description': description[:500] if description else 'No description available',
-                'platform': platform,
-                'pick_of_the_week': pick_of_the_week
-            }
-        
+        if len(show['title']) > 2 and show['title'].lower() not in ['advertisement', 'related']:
+            return show
+
         return None
     
     def _parse_show_from_heading(self, heading) -> Optional[Dict[str, Any]]:
         """Parse show data starting from a heading element."""
-        title_text = heading.get_text(strip=True)
+        title_text = _fast_text(heading)
         
         # Extract show title (remove number prefix)
-        title_match = re.match(r'^\d+\.\s*(.+)', title_text)
+        title_match = _NUMBERED_TITLE_RE.match(title_text)
         if not title_match:
             return None
         
         raw_title = title_match.group(1).strip()
-        
-        # Check if this is the "Pick of the week" show
-        pick_of_the_week = False
-        show_title = raw_title
-        
-        # Handle "Pick of the week" prefix
-        if raw_title.lower().startswith('pick of the week'):
-            pick_of_the_week = True
-            # Remove the prefix and clean up the title
-            show_title = re.sub(r'^pick of the week\s*', '', raw_title, flags=re.IGNORECASE).strip()
-        
-        # Look for description in following paragraphs
-        description = ""
-        platform = ""
-        
-        # Find next siblings for description
-        current = heading.next_sibling
+
+        # Look for description in the following paragraphs (filtered
+        # sibling walk, same pattern as the Guardian-heading parser)
         description_parts: list[str] = []
-        while current and len(description_parts) < 3:  # Limit to avoid getting too much
-            if hasattr(current, 'name'):
-                if current.name in ['p']:
-                    text = current.get_text(strip=True)
-                    if text and not text.startswith(('http', 'www')):
-                        description_parts.append(text)
-                elif current.name in ['h1', 'h2', 'h3'] and current != heading:
-                    break  # Stop at next heading
-            current = current.next_sibling
-        
-        description = ' '.join(description_parts)
-        
-        # Extract platform information
-        platform = self._extract_platform(description + " " + show_title)
-        
-        return {
-            'title': show_title,
-            'description': description[:500],  # Limit description length
-            'platform': platform,
-            'pick_of_the_week': pick_of_the_week
-        }
+
+        for sibling in heading.find_next_siblings(['p', 'h1', 'h2', 'h3'], limit=6):
+            if sibling.name != 'p':
+                break  # Stop at next heading
+            text = _fast_text(sibling)
+            if text and not text.startswith(('http', 'www')):
+                description_parts.append(text)
+                if len(description_parts) == 3:  # Limit to avoid getting too much
+                    break
+
+        return self._build_show(raw_title, ' '.join(description_parts))
     
     def _parse_show_from_element(self, element) -> Optional[Dict[str, Any]]:
         """Parse show data starting from a bold/strong element."""
-        title_text = element.get_text(strip=True)
+        title_text = _fast_text(element)
         
         # Extract show title
-        title_match = re.match(r'^\d+\.\s*(.+)', title_text)
+        title_match = _NUMBERED_TITLE_RE.match(title_text)
         if not title_match:
             return None
         
         raw_title = title_match.group(1).strip()
-        
-        # Check if this is the "Pick of the week" show
-        pick_of_the_week = False
-        show_title = raw_title
-        
-        # Handle "Pick of the week" prefix
-        if raw_title.lower().startswith('pick of the week'):
-            pick_of_the_week = True
-            # Remove the prefix and clean up the title
-            show_title = re.sub(r'^pick of the week\s*', '', raw_title, flags=re.IGNORECASE).strip()
-        
+
         # Look for description in parent paragraph or following text
         description = ""
         parent = element.parent
-        
+
         if parent:
             # Get text from parent, excluding the title part
-            full_text = parent.get_text(strip=True)
+            full_text = _fast_text(parent)
             if title_text in full_text:
                 description = full_text.replace(title_text, '').strip()
-        
-        platform = self._extract_platform(description + " " + show_title)
-        
-        return {
-            'title': show_title,
-            'description': description[:500],
-            'platform': platform,
-            'pick_of_the_week': pick_of_the_week
-        }
+
+        return self._build_show(raw_title, description)
     
     def _parse_shows_from_body(self, soup) -> List[Dict[str, Any]]:
         """Fallback method to parse shows from article body."""
         shows = []
         
         # Look for the main article content
-        article_body = soup.find(['div'], class_=re.compile(r'article|content|body'))
+        article_body = soup.find(['div'], class_=_ARTICLE_BODY_CLASS_RE)
         
         if not article_body:
             # Fallback to looking in the entire page
             article_body = soup
         
-        # Find all text that might be show titles (numbered items)
-        text_content = article_body.get_text()
-        
-        # Split by common patterns and look for numbered items
-        lines = text_content.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if re.match(r'^\d+\.\s+', line):
-                # This looks like a numbered show
-                title_match = re.match(r'^\d+\.\s*(.+)', line)
-                if title_match:
-                    raw_title = title_match.group(1).strip()
-                    
-                    # Check if this is the "Pick of the week" show
-                    pick_of_the_week = False
-                    show_title = raw_title
-                    
-                    # Handle "Pick of the week" prefix
-                    if raw_title.lower().startswith('pick of the week'):
-                        pick_of_the_week = True
-                        # Remove the prefix and clean up the title
-                        show_title = re.sub(r'^pick of the week\s*', '', raw_title, flags=re.IGNORECASE).strip()
-                    
-                    # For fallback method, we have limited description
-                    shows.append({
-                        'title': show_title,
-                        'description': 'Description not available',
-                        'platform': self._extract_platform(show_title),
-                        'pick_of_the_week': pick_of_the_week
-                    })
+        # Numbered items live in paragraphs, so test each <p> directly
+        # instead of materializing the whole body's text and re-splitting.
+        # One multiline finditer both detects and captures every numbered
+        # line in the paragraph's text (entries after an embedded newline
+        # were previously lost), replacing the old match-then-rematch pair.
+        for paragraph in article_body.find_all('p'):
+            for title_match in _NUMBERED_LINE_RE.finditer(_fast_text(paragraph)):
+                # For fallback method, we have limited description
+                shows.append(self._build_show(title_match.group(1).strip(), '',
+                                              'Description not available'))
         
         return shows
     
@@ -462,36 +634,11 @@ class GuardianScraper:
         if not text:
             return "Platform not specified"
         
-        text_lower = text.lower()
-        
-        # Common streaming platforms
-        platforms = {
-            'netflix': 'Netflix',
-            'amazon prime': 'Amazon Prime Video',
-            'prime video': 'Amazon Prime Video',
-            'disney+': 'Disney+',
-            'disney plus': 'Disney+',
-            'hbo max': 'HBO Max',
-            'hbo': 'HBO',
-            'hulu': 'Hulu',
-            'apple tv': 'Apple TV+',
-            'paramount+': 'Paramount+',
-            'peacock': 'Peacock',
-            'bbc iplayer': 'BBC iPlayer',
-            'itv hub': 'ITV Hub',
-            'all 4': 'All 4',
-            'channel 4': 'All 4',
-            'sky': 'Sky',
-            'now tv': 'NOW TV',
-            'britbox': 'BritBox',
-            'youtube': 'YouTube',
-            'crunchyroll': 'Crunchyroll'
-        }
-        
-        for key, platform in platforms.items():
-            if key in text_lower:
-                return platform
-        
+        # One linear scan over the text; the first platform mentioned wins
+        match = _PLATFORM_RE.search(text.lower())
+        if match:
+            return _PLATFORMS[match.group(0)]
+
         return "Platform not specified"
 
 
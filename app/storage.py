@@ -3,11 +3,17 @@ Data storage module for Guardian Seven Best Shows Monitor.
 Handles tracking of processed articles and storing show data using JSON files.
 """
 
+import hashlib
 import json
+import mmap
 import os
+import re
 import shutil
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Union
 import logging
 from pathlib import Path
 
@@ -15,6 +21,85 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# orjson parses ~3x and serializes up to ~10x faster than stdlib json;
+# it stays optional, with the stdlib as a drop-in fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+# Below this size a plain read is cheaper than setting up a mapping
+_MMAP_THRESHOLD = 1 << 20
+
+
+# (second, iso_string) pair backing _now_iso's per-second cache
+_iso_cache = (0, '')
+
+
+def _now_iso() -> str:
+    """
+    Current time as an ISO-8601 string, cached per second. Building a
+    datetime and formatting it costs ~10x a time() call; the storage
+    timestamps only need second precision, and all writes within one
+    commit share the same string.
+    """
+    global _iso_cache
+    sec = int(time.time())
+    if sec != _iso_cache[0]:
+        _iso_cache = (sec, datetime.fromtimestamp(sec).isoformat())
+    return _iso_cache[1]
+
+
+def _json_loads(content: bytes) -> Any:
+    """Parse JSON bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _atomic_write_bytes(file_path: Path, payload: bytes) -> None:
+    """
+    Publish a file atomically: write a .tmp sibling, fsync it, then
+    os.replace it over the destination. A crash mid-write can no longer
+    leave a truncated file that readers half-parse into the empty-state
+    fallback, and the mtime bump the parse cache keys on stays atomic.
+    """
+    tmp_path = file_path.with_suffix(file_path.suffix + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, file_path)
+
+
+def _read_json_file(file_path: Path, size: int) -> Any:
+    """
+    Read and parse a JSON file. Files past _MMAP_THRESHOLD are mapped
+    instead of read, letting the parser consume pages straight from the
+    page cache without the extra kernel-to-userspace copy; orjson parses
+    the mapping in place via the buffer protocol.
+    """
+    if size > _MMAP_THRESHOLD and orjson is not None:
+        with open(file_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # memoryview satisfies orjson's declared types; the parse
+                # still reads straight from the mapped pages
+                return orjson.loads(memoryview(mm))
+    return _json_loads(file_path.read_bytes())
+
+
+def _json_dumps(data: Any) -> bytes:
+    """
+    Serialize to compact JSON bytes with orjson when available. The data
+    files are machine-read; skipping indentation roughly halves both the
+    serialize time and the bytes written (pipe through
+    `python -m json.tool` when a human needs to look inside).
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
 class ShowDataStorage:
     """Handles data persistence for the Guardian Seven Best Shows Monitor."""
     
@@ -39,7 +124,36 @@ class ShowDataStorage:
         self.last_checked_file = self.data_dir / "last_checked.json"
         self.shows_history_file = self.data_dir / "shows_history.json"
         self.processed_articles_file = self.data_dir / "processed_articles.json"
-        
+        self.index_validators_file = self.data_dir / "index_validators.json"
+
+        # Lazily populated cache of processed URLs so membership checks
+        # don't re-read and re-parse the JSON file per article
+        self._processed_urls: Optional[Set[str]] = None
+
+        # URLs already present in shows history, so repeated saves check
+        # membership in O(1) instead of scanning the entry list each time
+        self._history_urls: Optional[Set[str]] = None
+
+        # Fingerprint of the last-checked article actually written, so
+        # polls that land on the same article skip the serialize + write
+        self._last_checked_hash: Optional[bytes] = None
+
+        # Columnar search index over recent history: lowercased titles and
+        # descriptions in flat parallel lists, rebuilt when the history
+        # file changes, so searches scan contiguous strings instead of
+        # pointer-chasing nested dicts
+        self._search_cols: Optional[tuple] = None
+
+        # Parsed-JSON cache keyed by path, validated against file mtime so
+        # back-to-back reads (e.g. get_storage_stats followed by
+        # get_last_checked_article) parse each file at most once
+        self._json_cache: Dict[str, tuple] = {}
+
+        # Transaction state: while active, writes are buffered per file
+        # and flushed once on exit instead of hitting disk per call
+        self._in_transaction = False
+        self._pending_writes: Dict[str, Any] = {}
+
         logger.info(f"Storage initialized with data directory: {self.data_dir}")
 
     def _safe_load_json(self, file_path: Path, default: Any, expected_type: Optional[type] = None) -> Any:
@@ -54,18 +168,37 @@ class ShowDataStorage:
         Returns:
             Parsed JSON data or default value
         """
+        # Reads inside a transaction must see writes buffered earlier in
+        # the same transaction, not the stale on-disk state
+        if self._in_transaction:
+            pending = self._pending_writes.get(str(file_path))
+            if pending is not None:
+                if expected_type is not None and not isinstance(pending, expected_type):
+                    return default
+                return pending
+
         try:
             if not file_path.exists():
                 return default
-            content = file_path.read_text(encoding='utf-8')
-            if not content.strip():
+
+            # Serve from the parsed cache while the file is unchanged
+            cache_key = str(file_path)
+            stat = os.stat(file_path)
+            mtime = stat.st_mtime_ns
+            cached = self._json_cache.get(cache_key)
+            if cached is not None and cached[0] == mtime:
+                data = cached[1]
+            elif stat.st_size == 0:
                 return default
-            data = json.loads(content)
+            else:
+                data = _read_json_file(file_path, stat.st_size)
+                self._json_cache[cache_key] = (mtime, data)
+
             if expected_type is not None and not isinstance(data, expected_type):
                 logger.warning(f"Unexpected structure in {file_path.name} (expected {expected_type.__name__}), using default")
                 return default
             return data
-        except (json.JSONDecodeError, IOError, PermissionError) as e:
+        except (ValueError, IOError, PermissionError) as e:
             logger.warning(f"Failed to load {file_path.name}, using default: {e}")
             return default
 
@@ -80,19 +213,70 @@ class ShowDataStorage:
         Returns:
             True if successful, False otherwise
         """
+        # Drop the stale parsed copy before touching the file - callers
+        # typically mutate the loaded object in place prior to writing
+        self._json_cache.pop(str(file_path), None)
+
+        # Inside a transaction, buffer the final state per file and let
+        # __exit__ flush each one once
+        if self._in_transaction:
+            self._pending_writes[str(file_path)] = data
+            return True
+
+        return self._flush_write(file_path, data)
+
+    def _flush_write(self, file_path: Path, data) -> bool:
+        """Perform the actual backup + atomic write for one file."""
         try:
             # Backup existing file
             if file_path.exists() and file_path.stat().st_size > 0:
                 bak_path = file_path.with_suffix(file_path.suffix + '.bak')
                 shutil.copy2(file_path, bak_path)
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Serialize in one pass and publish atomically in one replace -
+            # json.dump would issue a small f.write per token instead
+            _atomic_write_bytes(file_path, _json_dumps(data))
+
+            # The object just written IS the file's content, so seed the
+            # parsed cache with it - the next read skips the reparse
+            self._json_cache[str(file_path)] = (os.stat(file_path).st_mtime_ns, data)
             return True
         except (IOError, PermissionError) as e:
             logger.error(f"Error writing {file_path.name}: {e}")
             return False
 
+    @contextmanager
+    def transaction(self):
+        """
+        Batch several storage mutations into one write per file.
+
+        Methods called inside the block mutate buffered state; each
+        touched file is serialized, backed up and atomically replaced
+        exactly once on exit, so e.g. save_shows_data +
+        add_processed_article + update_last_checked_article cost three
+        flushes total instead of one per call per file. Nested use is a
+        no-op; the outermost block flushes.
+
+        Usage:
+            with storage.transaction():
+                storage.save_shows_data(...)
+                storage.add_processed_article(...)
+        """
+        if self._in_transaction:
+            yield self
+            return
+
+        self._in_transaction = True
+        try:
+            yield self
+            self._in_transaction = False
+            for path_str, data in self._pending_writes.items():
+                if not self._flush_write(Path(path_str), data):
+                    logger.error(f"Transaction flush failed for {Path(path_str).name}")
+        finally:
+            self._in_transaction = False
+            self._pending_writes = {}
+
     def get_last_checked_article(self) -> Optional[Dict[str, str]]:
         """
         Get information about the last checked article.
@@ -119,9 +303,25 @@ class ShowDataStorage:
         Returns:
             True if successful, False otherwise
         """
+        # Skip the serialize + write when this process already recorded
+        # the same article (timestamps excluded - they change every poll
+        # without carrying new information about which article was seen).
+        # Only skip once a .bak of that content exists, so recovery
+        # behaviour is unchanged.
+        payload_hash = hashlib.blake2b(
+            f"{article_url}|{article_title}|{article_date}".encode(),
+            digest_size=16,
+        ).digest()
+        bak_path = self.last_checked_file.with_suffix(
+            self.last_checked_file.suffix + '.bak'
+        )
+        if payload_hash == self._last_checked_hash and bak_path.exists():
+            logger.debug("Last checked article unchanged; skipping write")
+            return True
+
         if check_timestamp is None:
-            check_timestamp = datetime.now().isoformat()
-        
+            check_timestamp = _now_iso()
+
         data = {
             'url': article_url,
             'title': article_title,
@@ -129,12 +329,34 @@ class ShowDataStorage:
             'checked_at': check_timestamp,
             'last_updated': check_timestamp
         }
-        
+
         success = self._safe_write_json(self.last_checked_file, data)
         if success:
+            self._last_checked_hash = payload_hash
             logger.info(f"Updated last checked article: {article_title}")
         return success
     
+    def get_index_validators(self) -> Dict[str, Dict[str, str]]:
+        """
+        Get cached HTTP validators (ETag/Last-Modified) for series index pages.
+
+        Returns:
+            Dictionary mapping series URL to its validator headers
+        """
+        return self._safe_load_json(self.index_validators_file, {}, expected_type=dict)
+
+    def set_index_validators(self, validators: Dict[str, Dict[str, str]]) -> bool:
+        """
+        Persist HTTP validators for series index pages.
+
+        Args:
+            validators: Mapping of series URL to validator headers
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return self._safe_write_json(self.index_validators_file, validators)
+
     def is_article_processed(self, article_url: str) -> bool:
         """
         Check if an article has already been processed.
@@ -151,12 +373,17 @@ class ShowDataStorage:
     def get_processed_articles(self) -> Set[str]:
         """
         Get set of all processed article URLs.
-        
+
+        The set is loaded from disk once and cached; writes through
+        add_processed_article keep it in sync.
+
         Returns:
-            Set of processed article URLs
+            Set of processed article URLs (treat as read-only)
         """
-        data = self._safe_load_json(self.processed_articles_file, {'processed_urls': []}, expected_type=dict)
-        return set(data.get('processed_urls', []))
+        if self._processed_urls is None:
+            data = self._safe_load_json(self.processed_articles_file, {'processed_urls': []}, expected_type=dict)
+            self._processed_urls = set(data.get('processed_urls', []))
+        return self._processed_urls
     
     def add_processed_article(self, article_url: str, article_title: str, 
                             article_date: str, shows_count: int) -> bool:
@@ -192,7 +419,7 @@ class ShowDataStorage:
                 'title': article_title,
                 'date': article_date,
                 'shows_count': shows_count,
-                'processed_at': datetime.now().isoformat()
+                'processed_at': _now_iso()
             }
             
             # Clean up old processed articles (keep only last 100)
@@ -201,6 +428,9 @@ class ShowDataStorage:
             # Write back to file
             success = self._safe_write_json(self.processed_articles_file, processed_data)
             if success:
+                # Keep the in-memory URL cache in sync (cleanup may have
+                # dropped old entries as well as adding the new one)
+                self._processed_urls = set(processed_data['processed_urls'])
                 logger.info(f"Added processed article: {article_title}")
             return success
             
@@ -208,6 +438,32 @@ class ShowDataStorage:
             logger.error(f"Error updating processed articles file: {e}")
             return False
     
+    def commit_article(self, article_url: str, article_title: str,
+                       article_date: str, shows: List[Dict[str, str]]) -> bool:
+        """
+        Persist one processed article in a single call: history entry,
+        processed-articles record, and last-checked marker, sharing one
+        timestamp. Stops at the first failed write so a partial commit
+        leaves the article unprocessed and eligible for retry.
+
+        Args:
+            article_url: URL of the source article
+            article_title: Title of the article
+            article_date: Publication date (YYYY-MM-DD)
+            shows: List of show dictionaries
+
+        Returns:
+            True if all writes succeeded, False otherwise
+        """
+        timestamp = _now_iso()
+
+        if not self.save_shows_data(article_url, article_title, article_date, shows):
+            return False
+        if not self.add_processed_article(article_url, article_title, article_date, len(shows)):
+            return False
+        return self.update_last_checked_article(article_url, article_title, article_date,
+                                                check_timestamp=timestamp)
+
     def _cleanup_processed_articles(self, processed_data: Dict, max_articles: int = 100) -> None:
         """
         Clean up old processed articles, keeping only the most recent ones.
@@ -269,9 +525,8 @@ class ShowDataStorage:
                 return {'status': 'no_file', 'message': 'No processed articles file found'}
             
             # Load current data
-            with open(self.processed_articles_file, 'r', encoding='utf-8') as f:
-                processed_data = json.load(f)
-            
+            processed_data = _json_loads(self.processed_articles_file.read_bytes())
+
             original_count = len(processed_data.get('processed_urls', []))
             
             if original_count <= max_articles:
@@ -287,8 +542,7 @@ class ShowDataStorage:
             self._cleanup_processed_articles(processed_data, max_articles)
             
             # Save cleaned data
-            with open(self.processed_articles_file, 'w', encoding='utf-8') as f:
-                json.dump(processed_data, f, indent=2, ensure_ascii=False)
+            _atomic_write_bytes(self.processed_articles_file, _json_dumps(processed_data))
             
             final_count = len(processed_data.get('processed_urls', []))
             removed_count = original_count - final_count
@@ -323,19 +577,22 @@ class ShowDataStorage:
         try:
             # Load existing history
             history = self._safe_load_json(self.shows_history_file, [], expected_type=list)
-            
-            # Check if this article URL already exists in history
-            for existing_entry in history:
-                if existing_entry.get('article_url') == article_url:
-                    logger.info(f"Article already exists in history: {article_title}")
-                    return True  # Not an error, just already exists
-            
+
+            # Check if this article URL already exists in history - the URL
+            # set makes repeat saves O(1) instead of a scan per call
+            if self._history_urls is None:
+                self._history_urls = {e.get('article_url') for e in history}
+            if article_url in self._history_urls:
+                logger.info(f"Article already exists in history: {article_title}")
+                return True  # Not an error, just already exists
+
             # Create new entry
             entry = {
                 'article_url': article_url,
                 'article_title': article_title,
                 'article_date': article_date,
-                'saved_at': datetime.now().isoformat(),
+                'saved_at': _now_iso(),
+                'saved_at_ts': int(time.time()),
                 'shows_count': len(shows),
                 'shows': shows
             }
@@ -346,6 +603,7 @@ class ShowDataStorage:
             # Write back to file (no artificial limit - keep all history)
             success = self._safe_write_json(self.shows_history_file, history)
             if success:
+                self._history_urls.add(article_url)
                 logger.info(f"Saved {len(shows)} shows from {article_title}")
             return success
             
@@ -377,54 +635,105 @@ class ShowDataStorage:
         Returns:
             List of shows from the specified platform
         """
-        platform_shows = []
+        return list(islice(self.iter_shows_by_platform(platform), limit))
+
+    def iter_shows_by_platform(self, platform: str) -> Iterator[Dict[str, str]]:
+        """
+        Lazily yield shows from the given platform, newest first.
+
+        Generator variant of get_shows_by_platform: callers that only
+        consume a couple of results (e.g. via itertools.islice) stop the
+        scan early instead of materializing the full filtered list.
+
+        Args:
+            platform: Platform name to filter by
+
+        Yields:
+            Show dictionaries with article context added
+        """
+        platform_lower = platform.lower()  # Lower the query once, not per show
         history = self.get_shows_history(limit=50)  # Get more history to search through
-        
+
         for entry in history:
             for show in entry.get('shows', []):
-                if show.get('platform', '').lower() == platform.lower():
+                if show.get('platform', '').lower() == platform_lower:
                     # Add article context to show data
                     show_with_context = show.copy()
                     show_with_context['article_date'] = entry['article_date']
                     show_with_context['article_title'] = entry['article_title']
-                    platform_shows.append(show_with_context)
-                    
-                    if len(platform_shows) >= limit:
-                        return platform_shows
-        
-        return platform_shows
+                    yield show_with_context
     
-    def search_shows(self, query: str, limit: int = 20) -> List[Dict[str, str]]:
+    def search_shows(self, query: Union[str, List[str]], limit: int = 20) -> List[Dict[str, str]]:
         """
         Search for shows by title or description.
-        
+
         Args:
-            query: Search query
+            query: Search query, or a list of queries matched as
+                alternatives in a single scan
             limit: Maximum number of results
-            
+
         Returns:
             List of matching shows
         """
-        query_lower = query.lower()
+        matches: Callable[[str], object]
+        if isinstance(query, str):
+            # Single needle: str.__contains__ is the fastest option
+            query_lower = query.lower()
+            matches = lambda text: query_lower in text
+        else:
+            if not query:
+                # An empty alternation would match every string
+                return []
+            # Multiple needles: one compiled alternation scans each string
+            # once instead of once per query
+            pattern = re.compile('|'.join(re.escape(q.lower()) for q in query))
+            matches = pattern.search
+
         matching_shows = []
-        history = self.get_shows_history(limit=50)
-        
-        for entry in history:
-            for show in entry.get('shows', []):
-                title = show.get('title', '').lower()
-                description = show.get('description', '').lower()
-                
-                if query_lower in title or query_lower in description:
-                    # Add article context
-                    show_with_context = show.copy()
-                    show_with_context['article_date'] = entry['article_date']
-                    show_with_context['article_title'] = entry['article_title']
-                    matching_shows.append(show_with_context)
-                    
-                    if len(matching_shows) >= limit:
-                        return matching_shows
-        
+        titles_lc, descriptions_lc, refs = self._get_search_columns()
+
+        for i, title_lc in enumerate(titles_lc):
+            if matches(title_lc) or matches(descriptions_lc[i]):
+                # Add article context
+                show, entry = refs[i]
+                show_with_context = show.copy()
+                show_with_context['article_date'] = entry['article_date']
+                show_with_context['article_title'] = entry['article_title']
+                matching_shows.append(show_with_context)
+
+                if len(matching_shows) >= limit:
+                    break
+
         return matching_shows
+
+    def _get_search_columns(self) -> tuple:
+        """
+        Get the columnar search index, rebuilding it if the history changed.
+
+        Returns:
+            Tuple of (lowercased titles, lowercased descriptions, and
+            (show, entry) references) as parallel lists
+        """
+        try:
+            mtime = os.stat(self.shows_history_file).st_mtime_ns
+        except OSError:
+            mtime = -1
+
+        if self._search_cols is not None and self._search_cols[0] == mtime:
+            return self._search_cols[1]
+
+        titles_lc: List[str] = []
+        descriptions_lc: List[str] = []
+        refs: List[tuple] = []
+        for entry in self.get_shows_history(limit=50):
+            for show in entry.get('shows', []):
+                titles_lc.append(show.get('title', '').lower())
+                descriptions_lc.append(show.get('description', '').lower())
+                refs.append((show, entry))
+
+        columns = (titles_lc, descriptions_lc, refs)
+        self._search_cols = (mtime, columns)
+        return columns
     
     def get_storage_stats(self) -> Dict[str, Any]:
         """
@@ -475,9 +784,8 @@ class ShowDataStorage:
                 return True
             
             # Load existing history
-            with open(self.shows_history_file, 'r', encoding='utf-8') as f:
-                history = json.load(f)
-            
+            history = _json_loads(self.shows_history_file.read_bytes())
+
             # Track seen URLs and keep only the first occurrence (most recent)
             seen_urls = set()
             cleaned_history = []
@@ -487,10 +795,15 @@ class ShowDataStorage:
                 if article_url and article_url not in seen_urls:
                     seen_urls.add(article_url)
                     cleaned_history.append(entry)
-            
-            # Write back cleaned history
-            with open(self.shows_history_file, 'w', encoding='utf-8') as f:
-                json.dump(cleaned_history, f, indent=2, ensure_ascii=False)
+
+            # Nothing to do when the history is already duplicate-free
+            if len(cleaned_history) == len(history):
+                logger.info("No duplicate history entries found")
+                return True
+
+            # Write back cleaned history and drop the now-stale URL set
+            _atomic_write_bytes(self.shows_history_file, _json_dumps(cleaned_history))
+            self._history_urls = None
             
             removed_count = len(history) - len(cleaned_history)
             logger.info(f"Cleaned up {removed_count} duplicate history entries")
@@ -515,69 +828,33 @@ class ShowDataStorage:
             
             # Clean up shows history
             if self.shows_history_file.exists():
-                with open(self.shows_history_file, 'r', encoding='utf-8') as f:
-                    history = json.load(f)
-                
-                # Filter entries newer than cutoff
-                filtered_history = []
-                for entry in history:
-                    try:
-                        entry_date = datetime.fromisoformat(entry['saved_at']).timestamp()
-                        if entry_date > cutoff_date:
-                            filtered_history.append(entry)
-                    except (ValueError, KeyError):
-                        # Keep entries with invalid dates to be safe
-                        filtered_history.append(entry)
-                
-                # Write back filtered data
-                with open(self.shows_history_file, 'w', encoding='utf-8') as f:
-                    json.dump(filtered_history, f, indent=2, ensure_ascii=False)
-                
-                removed_count = len(history) - len(filtered_history)
-                logger.info(f"Cleaned up {removed_count} old history entries")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
-            return False
-        """
-        Clean up old data entries (optional maintenance function).
-        
-        Args:
-            keep_days: Number of days of data to keep
-            
-        Returns:
-            True if cleanup was successful
-        """
-        try:
-            cutoff_date = datetime.now().timestamp() - (keep_days * 24 * 60 * 60)
-            
-            # Clean up shows history
-            if self.shows_history_file.exists():
-                with open(self.shows_history_file, 'r', encoding='utf-8') as f:
-                    history = json.load(f)
-                
-                # Filter entries newer than cutoff
+                history = _json_loads(self.shows_history_file.read_bytes())
+
+                # Filter entries newer than cutoff - entries written since
+                # saved_at_ts was introduced compare one integer, older
+                # ones fall back to parsing the ISO string
                 filtered_history = []
                 for entry in history:
-                    try:
-                        entry_date = datetime.fromisoformat(entry['saved_at']).timestamp()
-                        if entry_date > cutoff_date:
+                    entry_date = entry.get('saved_at_ts')
+                    if entry_date is None:
+                        try:
+                            entry_date = datetime.fromisoformat(entry['saved_at']).timestamp()
+                        except (ValueError, KeyError):
+                            # Keep entries with invalid dates to be safe
                             filtered_history.append(entry)
-                    except (ValueError, KeyError):
-                        # Keep entries with invalid dates to be safe
+                            continue
+                    if entry_date > cutoff_date:
                         filtered_history.append(entry)
-                
-                # Write back filtered data
-                with open(self.shows_history_file, 'w', encoding='utf-8') as f:
-                    json.dump(filtered_history, f, indent=2, ensure_ascii=False)
-                
+
+                # Write back filtered data and drop the now-stale URL set
+                _atomic_write_bytes(self.shows_history_file, _json_dumps(filtered_history))
+                self._history_urls = None
+
                 removed_count = len(history) - len(filtered_history)
                 logger.info(f"Cleaned up {removed_count} old history entries")
-            
+
             return True
-            
+
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
             return False
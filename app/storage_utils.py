@@ -95,15 +95,6 @@ def cleanup_data(storage, days):
     
     success = storage.cleanup_old_data(keep_days=days)
     
-    if success:
-        print("✓ Cleanup completed successfully")
-        show_stats(storage)
-    else:
-        print("✗ Cleanup failed")
-    """Clean up old data."""
-    print(f"Cleaning up data older than {days} days...")
-    success = storage.cleanup_old_data(keep_days=days)
-    
     if success:
         print("✓ Cleanup completed successfully")
         show_stats(storage)
@@ -5,10 +5,62 @@ This demonstrates what the Discord notifications will look like.
 """
 
 from .discord_bot import GuardianDiscordBot
+import argparse
 import os
+from types import MappingProxyType
+
+# Sample show data based on real Guardian content, built once at import
+# (read-only views so repeated runs share the same objects safely)
+SAMPLE_SHOWS = tuple(MappingProxyType(d) for d in [
+    {
+        'title': 'Hostage',
+        'description': 'Abigail Dalton has assured her husband, Alex, that becoming prime minister won\'t stop her from making their marriage work. A political thriller that explores power and personal relationships.',
+        'platform': 'Netflix'
+    },
+    {
+        'title': 'Long Story Short',
+        'description': 'Exciting news for BoJack Horseman fans: creator Raphael Bob-Waksberg explores the triumphs and tragedies of life in this animated anthology series.',
+        'platform': 'Netflix'
+    },
+    {
+        'title': 'The Real Housewives of London',
+        'description': 'Another bout of soul-crushing affluenza, this time introducing the London arm of a franchise that has made reality TV history.',
+        'platform': 'Platform not specified'
+    },
+    {
+        'title': 'America\'s Team: The Gambler and His Cowboys',
+        'description': '"This is a soap opera, 365 days a year." Dallas Cowboys owner, president and general manager Jerry Jones built an empire.',
+        'platform': 'Netflix'
+    },
+    {
+        'title': 'The Twisted Tale of Amanda Knox',
+        'description': 'This eight-part drama is written from the point of view of Amanda Knox, who was initially convicted of murdering her roommate in Italy.',
+        'platform': 'Disney+'
+    },
+    {
+        'title': 'Invasion',
+        'description': 'At times during its first two seasons, this divisive sci-fi show has achieved the seemingly impossible: making an alien invasion boring.',
+        'platform': 'Apple TV+'
+    },
+    {
+        'title': 'The Truth About Jussie Smollett?',
+        'description': 'The bizarre story of the allegedly racist and homophobic hate attack against actor Jussie Smollett begins to unravel.',
+        'platform': 'Netflix'
+    }
+])
+
+def _parse_args():
+    """Parse batch-mode flags so the test runs without a TTY."""
+    parser = argparse.ArgumentParser(description="Test Discord integration with sample data")
+    parser.add_argument('--send-summary', action='store_true',
+                        help='Also send a platform summary')
+    parser.add_argument('--send-error', action='store_true',
+                        help='Also send a test error notification')
+    return parser.parse_args()
 
 def main():
     """Test Discord bot with sample Guardian data."""
+    args = _parse_args()
     print("🧪 Testing Discord Integration with Sample Data")
     print("=" * 50)
     
@@ -25,83 +77,39 @@ def main():
         return
     
     print("✅ Discord webhook configured")
-    
-    # Sample show data based on real Guardian content
-    sample_shows = [
-        {
-            'title': 'Hostage',
-            'description': 'Abigail Dalton has assured her husband, Alex, that becoming prime minister won\'t stop her from making their marriage work. A political thriller that explores power and personal relationships.',
-            'platform': 'Netflix'
-        },
-        {
-            'title': 'Long Story Short',
-            'description': 'Exciting news for BoJack Horseman fans: creator Raphael Bob-Waksberg explores the triumphs and tragedies of life in this animated anthology series.',
-            'platform': 'Netflix'
-        },
-        {
-            'title': 'The Real Housewives of London',
-            'description': 'Another bout of soul-crushing affluenza, this time introducing the London arm of a franchise that has made reality TV history.',
-            'platform': 'Platform not specified'
-        },
-        {
-            'title': 'America\'s Team: The Gambler and His Cowboys',
-            'description': '"This is a soap opera, 365 days a year." Dallas Cowboys owner, president and general manager Jerry Jones built an empire.',
-            'platform': 'Netflix'
-        },
-        {
-            'title': 'The Twisted Tale of Amanda Knox',
-            'description': 'This eight-part drama is written from the point of view of Amanda Knox, who was initially convicted of murdering her roommate in Italy.',
-            'platform': 'Disney+'
-        },
-        {
-            'title': 'Invasion',
-            'description': 'At times during its first two seasons, this divisive sci-fi show has achieved the seemingly impossible: making an alien invasion boring.',
-            'platform': 'Apple TV+'
-        },
-        {
-            'title': 'The Truth About Jussie Smollett?',
-            'description': 'The bizarre story of the allegedly racist and homophobic hate attack against actor Jussie Smollett begins to unravel.',
-            'platform': 'Netflix'
-        }
-    ]
-    
+
+    sample_shows = SAMPLE_SHOWS
+
     print(f"📱 Sending notification for {len(sample_shows)} shows...")
-    
-    # Send main notification
-    success = bot.send_new_shows_alert(
+
+    # Queue everything and send in one webhook POST - Discord accepts up
+    # to 10 embeds per message, so the optional extras ride along instead
+    # of costing their own round trips and rate-limit budget
+    bot.begin_batch()
+
+    # Queue main notification
+    bot.send_new_shows_alert(
         article_title="Hostage to Long Story Short: the seven best shows to stream this week",
         article_date="2025-08-15",
         article_url="https://www.theguardian.com/tv-and-radio/2025/aug/15/hostage-to-long-story-short-the-seven-best-shows-to-stream-this-week",
         shows=sample_shows
     )
-    
-    if success:
-        print("✅ Main notification sent successfully!")
-        
-        # Ask if user wants platform summary
-        response = input("\nSend platform summary as well? (y/n): ").lower().strip()
-        
-        if response == 'y':
-            success = bot.send_platform_summary(sample_shows, "2025-08-15")
-            if success:
-                print("✅ Platform summary sent successfully!")
-            else:
-                print("❌ Failed to send platform summary")
-        
-        # Ask if user wants to test error notification
-        response = input("\nSend test error notification? (y/n): ").lower().strip()
-        
-        if response == 'y':
-            success = bot.send_error_notification(
-                "This is a test error message",
-                "Testing error notification functionality"
-            )
-            if success:
-                print("✅ Error notification sent successfully!")
-            else:
-                print("❌ Failed to send error notification")
+
+    # Extras are opted into via flags rather than interactive prompts,
+    # so the whole test runs unattended (e.g. from cron or CI)
+    if args.send_summary:
+        bot.send_platform_summary(sample_shows, "2025-08-15")
+
+    if args.send_error:
+        bot.send_error_notification(
+            "This is a test error message",
+            "Testing error notification functionality"
+        )
+
+    if bot.flush():
+        print("✅ Notifications sent successfully in one batch!")
     else:
-        print("❌ Failed to send main notification")
+        print("❌ Failed to send notifications")
     
     print("\n🎉 Discord test completed!")
     print("\nCheck your Discord channel to see the notifications!")
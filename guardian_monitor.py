@@ -8,11 +8,8 @@ Designed for single-run execution (e.g., via cron job).
 import sys
 from pathlib import Path
 
-from app.main import main as run_main
-
-def print_usage():
-    """Print usage information."""
-    print("""
+# Usage text as a module constant so print_usage is a single write
+_USAGE = """
 Guardian Seven Best Shows Monitor - CLI Utility
 
 Usage:
@@ -41,34 +38,45 @@ Scheduling:
   0 * * * * cd /path/to/guardian-seven-best-shows-monitor && ./guardian_monitor.py
 
 For more information, see the README.md file.
-""")
+"""
+
+def print_usage():
+    """Print usage information."""
+    sys.stdout.write(_USAGE)
+
+# Commands mapped to main.py arguments, built once at import (tuples so
+# the values are immutable constants)
+_COMMAND_MAP = {
+    'run': (),           # Default: just run once
+    'test': ('--test',),
+    'status': ('--status',),
+    'config': ('--config',),
+}
 
 def main():
     """Main CLI entry point."""
     # Get command from arguments
     command = sys.argv[1] if len(sys.argv) > 1 else 'run'
-    
+
     # Handle help command
-    if command in ['help', '-h', '--help']:
+    if command in ('help', '-h', '--help'):
         print_usage()
         return
-    
-    # Map commands to main.py arguments
-    command_map = {
-        'run': [],           # Default: just run once
-        'test': ['--test'],
-        'status': ['--status'],
-        'config': ['--config']
-    }
-    
-    if command not in command_map:
-        print(f"❌ Unknown command: {command}")
+
+    main_args = _COMMAND_MAP.get(command)
+    if main_args is None:
+        sys.stderr.write(f"❌ Unknown command: {command}\n")
         print_usage()
         sys.exit(1)
-    
+
     # Set up sys.argv for main.py
-    sys.argv = ['main.py'] + command_map[command]
-    
+    sys.argv = ['main.py', *main_args]
+
+    # Import here rather than at module top: the help and unknown-command
+    # paths above never run the app, and pulling in main (and with it
+    # requests, bs4 and the rest) costs hundreds of ms at cold start
+    from app.main import main as run_main
+
     # Run the main application
     try:
         run_main()
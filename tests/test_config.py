@@ -0,0 +1,103 @@
+"""Tests for the lightweight INI parser in the config module."""
+
+import pytest
+
+from app.config import _getbool, _getint, _parse_ini_fast
+
+
+@pytest.fixture
+def ini_file(tmp_path):
+    """Write a config.ini-style file and return its path."""
+    def _write(content):
+        path = tmp_path / "config.ini"
+        path.write_text(content)
+        return path
+
+    return _write
+
+
+class TestParseIniFast:
+    def test_sections_and_values(self, ini_file):
+        path = ini_file(
+            "[app]\n"
+            "check_interval_hours = 1\n"
+            "\n"
+            "[http]\n"
+            "request_timeout = 30\n"
+        )
+        sections = _parse_ini_fast(path)
+
+        assert sections == {
+            "app": {"check_interval_hours": "1"},
+            "http": {"request_timeout": "30"},
+        }
+
+    def test_keys_are_lowercased(self, ini_file):
+        path = ini_file("[app]\nCheck_Interval_Hours = 1\n")
+
+        assert _parse_ini_fast(path)["app"] == {"check_interval_hours": "1"}
+
+    def test_comments_and_blank_lines_skipped(self, ini_file):
+        path = ini_file(
+            "# full-line hash comment\n"
+            "; full-line semicolon comment\n"
+            "\n"
+            "[app]\n"
+            "  # indented comment\n"
+            "key = value\n"
+        )
+
+        assert _parse_ini_fast(path) == {"app": {"key": "value"}}
+
+    def test_value_may_contain_equals(self, ini_file):
+        # Only the first = separates key from value, like configparser
+        path = ini_file("[app]\nquery = a=1&b=2\n")
+
+        assert _parse_ini_fast(path)["app"]["query"] == "a=1&b=2"
+
+    def test_quotes_kept_verbatim(self, ini_file):
+        # configparser does not strip quotes and neither do we
+        path = ini_file('[app]\nname = "Guardian Monitor"\n')
+
+        assert _parse_ini_fast(path)["app"]["name"] == '"Guardian Monitor"'
+
+    def test_surrounding_whitespace_stripped(self, ini_file):
+        path = ini_file("[app]\n   key   =   value with spaces   \n")
+
+        assert _parse_ini_fast(path)["app"]["key"] == "value with spaces"
+
+    def test_pairs_before_any_section_ignored(self, ini_file):
+        path = ini_file("orphan = value\n[app]\nkey = value\n")
+
+        assert _parse_ini_fast(path) == {"app": {"key": "value"}}
+
+    def test_empty_file(self, ini_file):
+        assert _parse_ini_fast(ini_file("")) == {}
+
+
+class TestGetbool:
+    @pytest.mark.parametrize("raw", ["1", "yes", "true", "on", "True", "YES"])
+    def test_truthy_values(self, raw):
+        assert _getbool({"key": raw}, "key") is True
+
+    @pytest.mark.parametrize("raw", ["0", "no", "false", "off", "False"])
+    def test_falsy_values(self, raw):
+        assert _getbool({"key": raw}, "key", default=True) is False
+
+    def test_missing_key_returns_default(self):
+        assert _getbool({}, "key") is False
+        assert _getbool({}, "key", default=True) is True
+
+    def test_unrecognised_value_returns_default(self):
+        assert _getbool({"key": "maybe"}, "key", default=True) is True
+
+
+class TestGetint:
+    def test_parses_integer(self):
+        assert _getint({"key": "42"}, "key") == 42
+
+    def test_missing_key_returns_default(self):
+        assert _getint({}, "key", default=7) == 7
+
+    def test_non_numeric_value_returns_default(self):
+        assert _getint({"key": "soon"}, "key", default=7) == 7
@@ -0,0 +1,70 @@
+"""Tests for the monitor's validator-persistence invariant."""
+
+import logging
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.main import GuardianMonitor
+
+
+VALIDATORS = {"https://example.com/series": {"etag": '"abc123"'}}
+
+
+@pytest.fixture
+def monitor(sample_article):
+    """A GuardianMonitor with mocked collaborators, no Discord/qBittorrent."""
+    mon = GuardianMonitor.__new__(GuardianMonitor)
+    mon.logger = logging.getLogger("test_monitor")
+    mon.config = MagicMock()
+    mon.discord_bot = None
+    mon.qbt_manager = None
+
+    mon.scraper = MagicMock()
+    mon.scraper.index_unchanged = False
+    mon.scraper.index_validators = VALIDATORS
+    mon.scraper.get_series_articles.return_value = [sample_article]
+    mon.scraper.parse_show_recommendations.return_value = [
+        {"title": "Test Show", "platform": "Netflix"}
+    ]
+    mon.scraper.parse_many.side_effect = lambda urls: {
+        url: mon.scraper.parse_show_recommendations(url) for url in urls
+    }
+
+    mon.storage = MagicMock()
+    mon.storage.is_article_processed.return_value = False
+    return mon
+
+
+class TestValidatorPersistence:
+    def test_persisted_after_successful_run(self, monitor):
+        with patch.object(monitor, "_save_shows_data", return_value=True):
+            assert monitor.check_for_new_shows() is True
+
+        monitor.storage.set_index_validators.assert_called_once_with(VALIDATORS)
+
+    def test_persisted_when_no_new_articles(self, monitor):
+        monitor.storage.is_article_processed.return_value = True
+
+        assert monitor.check_for_new_shows() is False
+        monitor.storage.set_index_validators.assert_called_once_with(VALIDATORS)
+
+    def test_not_persisted_when_parse_fails(self, monitor):
+        monitor.scraper.parse_show_recommendations.return_value = []
+
+        assert monitor.check_for_new_shows() is False
+        monitor.storage.set_index_validators.assert_not_called()
+
+    def test_not_persisted_when_save_fails(self, monitor):
+        with patch.object(monitor, "_save_shows_data", return_value=False):
+            assert monitor.check_for_new_shows() is False
+
+        monitor.storage.set_index_validators.assert_not_called()
+
+    def test_unchanged_index_short_circuits(self, monitor):
+        monitor.scraper.index_unchanged = True
+        monitor.scraper.get_series_articles.return_value = []
+
+        assert monitor.check_for_new_shows() is False
+        monitor.scraper.parse_show_recommendations.assert_not_called()
+        monitor.storage.set_index_validators.assert_not_called()
@@ -1,7 +1,7 @@
 """Unit tests for GuardianScraper parsing logic."""
 
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from bs4 import BeautifulSoup
@@ -96,3 +96,61 @@ class TestExtractPlatform:
 
     def test_no_platform(self, scraper):
         assert scraper._extract_platform("A great show") == "Platform not specified"
+
+
+class TestConditionalIndexFetch:
+    INDEX_HTML = (
+        b'<html><body>'
+        b'<a href="/tv-and-radio/2026/may/29/seven-best-shows-to-stream-this-week">'
+        b'Seven best shows</a>'
+        b'</body></html>'
+    )
+
+    def _response(self, status_code=200, headers=None, content=b""):
+        response = MagicMock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        response.content = content
+        return response
+
+    def test_fresh_fetch_records_validators(self, scraper):
+        response = self._response(
+            headers={"ETag": '"abc123"'}, content=self.INDEX_HTML
+        )
+        with patch.object(scraper, "_fetch_response", return_value=response):
+            articles = scraper.get_series_articles()
+
+        assert len(articles) == 1
+        assert scraper.index_unchanged is False
+        assert scraper.index_validators == {
+            scraper.series_urls[0]: {"etag": '"abc123"'}
+        }
+
+    def test_304_serves_cached_articles(self, scraper):
+        fresh = self._response(
+            headers={"ETag": '"abc123"'}, content=self.INDEX_HTML
+        )
+        with patch.object(scraper, "_fetch_response", return_value=fresh):
+            first = scraper.get_series_articles()
+
+        not_modified = self._response(status_code=304)
+        with patch.object(scraper, "_fetch_response", return_value=not_modified):
+            second = scraper.get_series_articles(validators=scraper.index_validators)
+
+        assert scraper.index_unchanged is True
+        assert second == first
+        # The validators sent with the conditional GET are carried forward
+        assert scraper.index_validators == {
+            scraper.series_urls[0]: {"etag": '"abc123"'}
+        }
+
+    def test_304_in_fresh_process_sets_unchanged_flag(self, scraper):
+        # No in-memory article cache: 304 yields no articles, but the
+        # unchanged flag tells callers this is the nothing-new case
+        not_modified = self._response(status_code=304)
+        validators = {scraper.series_urls[0]: {"etag": '"abc123"'}}
+        with patch.object(scraper, "_fetch_response", return_value=not_modified):
+            articles = scraper.get_series_articles(validators=validators)
+
+        assert articles == []
+        assert scraper.index_unchanged is True
@@ -120,3 +120,80 @@ class TestJsonRecovery:
         )
         bak_file = storage.last_checked_file.with_suffix(".json.bak")
         assert bak_file.exists()
+
+
+class TestIndexValidators:
+    def test_empty_state_returns_empty_dict(self, storage):
+        assert storage.get_index_validators() == {}
+
+    def test_round_trip(self, storage):
+        validators = {
+            "https://www.theguardian.com/tv-and-radio/series/the-seven-best-shows-to-stream-this-week": {
+                "etag": '"abc123"',
+                "last_modified": "Mon, 25 May 2026 10:00:00 GMT",
+            }
+        }
+        assert storage.set_index_validators(validators) is True
+        assert storage.get_index_validators() == validators
+
+    def test_survives_new_instance(self, storage, tmp_path):
+        from app.storage import ShowDataStorage
+
+        validators = {"https://example.com/series": {"etag": '"abc"'}}
+        storage.set_index_validators(validators)
+        reloaded = ShowDataStorage(data_dir=str(tmp_path))
+        assert reloaded.get_index_validators() == validators
+
+
+class TestTransaction:
+    VALIDATORS = {"https://example.com/series": {"etag": '"abc"'}}
+
+    def test_write_buffered_until_exit(self, storage):
+        with storage.transaction():
+            storage.set_index_validators(self.VALIDATORS)
+            assert not storage.index_validators_file.exists()
+
+        assert storage.index_validators_file.exists()
+
+    def test_read_your_writes_inside_transaction(self, storage):
+        with storage.transaction():
+            storage.set_index_validators(self.VALIDATORS)
+            assert storage.get_index_validators() == self.VALIDATORS
+
+    def test_flushed_data_visible_to_new_instance(self, storage, tmp_path):
+        from app.storage import ShowDataStorage
+
+        with storage.transaction():
+            storage.set_index_validators(self.VALIDATORS)
+
+        reloaded = ShowDataStorage(data_dir=str(tmp_path))
+        assert reloaded.get_index_validators() == self.VALIDATORS
+
+    def test_discarded_on_exception(self, storage):
+        with pytest.raises(RuntimeError):
+            with storage.transaction():
+                storage.set_index_validators(self.VALIDATORS)
+                raise RuntimeError("boom")
+
+        assert not storage.index_validators_file.exists()
+        assert storage.get_index_validators() == {}
+
+    def test_early_return_still_flushes(self, storage):
+        # Returning from inside the with block is a clean exit, not an
+        # error - writes buffered before the return must still land
+        def save_and_bail():
+            with storage.transaction():
+                storage.set_index_validators(self.VALIDATORS)
+                return False
+
+        assert save_and_bail() is False
+        assert storage.get_index_validators() == self.VALIDATORS
+
+    def test_nested_transaction_flushes_once_at_outer_exit(self, storage):
+        with storage.transaction():
+            with storage.transaction():
+                storage.set_index_validators(self.VALIDATORS)
+            # Inner exit must not flush the outer transaction's buffer
+            assert not storage.index_validators_file.exists()
+
+        assert storage.get_index_validators() == self.VALIDATORS